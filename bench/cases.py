@@ -0,0 +1,893 @@
+import json
+import os
+import pickle
+import sys
+from collections import deque
+from functools import partial
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional
+
+from koda import (
+    Err,
+    Fifth,
+    First,
+    Fourth,
+    Just,
+    Maybe,
+    Nothing,
+    Ok,
+    Result,
+    Second,
+    Third,
+    compose,
+    instrument,
+    load_once,
+    mapping_get,
+    mapping_get_all,
+    mapping_get_many,
+    mapping_get_path,
+    nothing,
+    returns_result,
+    safe_try,
+    to_maybe,
+)
+from koda.arrays import MaybeArray, ResultArray
+from koda.batch import (
+    collect_results,
+    map_n,
+    maybes_to_results,
+    partition_results,
+    results_to_maybes,
+    sequence_maybes,
+    validate,
+)
+from koda.dispatch import match_either
+from koda.do import result_do
+from koda.either import Either5
+from koda.pipeline import ResultPipeline
+from koda.serde import Container, JsonFormat, decode, encode
+from koda.stream import chunked_collect, filter_ok, flat_map_ok, map_ok
+from koda.trampoline import Bounce, FlatMap, Step, run
+
+
+def _inc(n: int) -> int:
+    return n + 1
+
+
+def _non_negative(n: int) -> Result[int, str]:
+    return Ok(n) if n % 10 else Err("divisible by 10")
+
+
+def _double(n: float) -> float:
+    return n * 2
+
+
+def create_ok(iterations: int) -> None:
+    for i in range(iterations):
+        Ok(i)
+
+
+def create_ok_of(iterations: int) -> None:
+    for i in range(iterations):
+        Ok.of(i & 0xFF)
+
+
+def create_err(iterations: int) -> None:
+    for i in range(iterations):
+        Err(i)
+
+
+def create_just(iterations: int) -> None:
+    for i in range(iterations):
+        Just(i)
+
+
+def create_nothing(iterations: int) -> None:
+    for _ in range(iterations):
+        Nothing()
+
+
+def run_mapping_get(iterations: int) -> None:
+    obj = {"a": 1, "b": 2, "c": 3}
+    for i in range(iterations // 2):
+        # misses
+        mapping_get(obj, "3")
+    for i in range(iterations // 2):
+        # hits
+        mapping_get(obj, "a")
+
+
+_DOCUMENT: Dict[str, Any] = {
+    "user": {"name": "a", "emails": [{"address": "a@b.c", "verified": True}]},
+    "id": 1,
+    "tags": ["x", "y"],
+}
+_KEYS = ("id", "user", "tags")
+_MISSING_KEYS = ("id", "account", "tags")
+_PATH = ("user", "emails", 0, "verified")
+_MISSING_PATH = ("user", "phones", 0, "verified")
+
+
+def run_mapping_get_many(iterations: int) -> None:
+    for i in range(iterations // 2):
+        mapping_get_many(_DOCUMENT, _MISSING_KEYS)
+    for i in range(iterations // 2):
+        mapping_get_many(_DOCUMENT, _KEYS)
+
+
+def run_mapping_get_many_naive(iterations: int) -> None:
+    for i in range(iterations // 2):
+        tuple([mapping_get(_DOCUMENT, key) for key in _MISSING_KEYS])
+    for i in range(iterations // 2):
+        tuple([mapping_get(_DOCUMENT, key) for key in _KEYS])
+
+
+def run_mapping_get_all(iterations: int) -> None:
+    for i in range(iterations // 2):
+        mapping_get_all(_DOCUMENT, _MISSING_KEYS)
+    for i in range(iterations // 2):
+        mapping_get_all(_DOCUMENT, _KEYS)
+
+
+def _get_path_flat_map(data: Dict[str, Any]) -> Maybe[Any]:
+    def get_index(items: Any) -> Maybe[Any]:
+        return Just(items[0]) if len(items) > 0 else nothing
+
+    return (
+        mapping_get(data, "user")
+        .flat_map(lambda user: mapping_get(user, _MISSING_PATH[1]))
+        .flat_map(get_index)
+        .flat_map(lambda email: mapping_get(email, "verified"))
+    )
+
+
+def _get_path_flat_map_hit(data: Dict[str, Any]) -> Maybe[Any]:
+    def get_index(items: Any) -> Maybe[Any]:
+        return Just(items[0]) if len(items) > 0 else nothing
+
+    return (
+        mapping_get(data, "user")
+        .flat_map(lambda user: mapping_get(user, "emails"))
+        .flat_map(get_index)
+        .flat_map(lambda email: mapping_get(email, "verified"))
+    )
+
+
+def run_mapping_get_path(iterations: int) -> None:
+    for i in range(iterations // 2):
+        mapping_get_path(_DOCUMENT, _MISSING_PATH)
+    for i in range(iterations // 2):
+        mapping_get_path(_DOCUMENT, _PATH)
+
+
+def run_mapping_get_path_flat_map(iterations: int) -> None:
+    for i in range(iterations // 2):
+        _get_path_flat_map(_DOCUMENT)
+    for i in range(iterations // 2):
+        _get_path_flat_map_hit(_DOCUMENT)
+
+
+def _half(n: int) -> Result[int, str]:
+    return Ok(n // 2) if n % 2 == 0 else Err("odd")
+
+
+def _half_maybe(n: int) -> Maybe[int]:
+    return Just(n // 2) if n % 2 == 0 else nothing
+
+
+def result_map(iterations: int) -> None:
+    ok: Result[int, str] = Ok(1)
+    err: Result[int, str] = Err("x")
+    for _ in range(iterations // 2):
+        ok.map(_inc)
+        err.map(_inc)
+
+
+def result_flat_map(iterations: int) -> None:
+    err: Result[int, str] = Err("x")
+    for i in range(iterations // 2):
+        Ok(i).flat_map(_half)
+        err.flat_map(_half)
+
+
+def result_apply(iterations: int) -> None:
+    ok: Result[int, str] = Ok(1)
+    err: Result[int, str] = Err("x")
+    fn: Result[Callable[[int], int], str] = Ok(_inc)
+    for _ in range(iterations // 2):
+        ok.apply(fn)
+        err.apply(fn)
+
+
+def result_get_or_else(iterations: int) -> None:
+    ok: Result[int, str] = Ok(1)
+    err: Result[int, str] = Err("x")
+    for _ in range(iterations // 2):
+        ok.get_or_else(0)
+        err.get_or_else(0)
+
+
+def maybe_map(iterations: int) -> None:
+    just: Maybe[int] = Just(1)
+    for _ in range(iterations // 2):
+        just.map(_inc)
+        nothing.map(_inc)
+
+
+def maybe_flat_map(iterations: int) -> None:
+    for i in range(iterations // 2):
+        Just(i).flat_map(_half_maybe)
+        nothing.flat_map(_half_maybe)
+
+
+def maybe_apply(iterations: int) -> None:
+    just: Maybe[int] = Just(1)
+    fn: Maybe[Callable[[int], int]] = Just(_inc)
+    for _ in range(iterations // 2):
+        just.apply(fn)
+        nothing.apply(fn)
+
+
+def maybe_get_or_else(iterations: int) -> None:
+    just: Maybe[int] = Just(1)
+    for _ in range(iterations // 2):
+        just.get_or_else(0)
+        nothing.get_or_else(0)
+
+
+def either_map(iterations: int) -> None:
+    first = First(1)
+    second = Second(2)
+    third = Third(3)
+    fourth = Fourth(4)
+    fifth = Fifth(5)
+    for _ in range(iterations // 5):
+        first.map_first(_inc).map_second(_inc)
+        second.map_second(_inc).map_third(_inc)
+        third.map_third(_inc).map_fourth(_inc)
+        fourth.map_fourth(_inc).map_fifth(_inc)
+        fifth.map_fifth(_inc).map_first(_inc)
+
+
+EITHERS: List[Either5[int, int, int, int, int]] = [
+    First(1),
+    Second(2),
+    Third(3),
+    Fourth(4),
+    Fifth(5),
+]
+
+
+def _double_int(n: int) -> int:
+    return n * 2
+
+
+def run_either_map_chain(iterations: int) -> None:
+    for _ in range(iterations // 5):
+        for either in EITHERS:
+            (
+                either.map_first(_inc)
+                .map_second(_double_int)
+                .map_third(_inc)
+                .map_fourth(_double_int)
+                .map_fifth(_inc)
+                .val
+            )
+
+
+def _either_isinstance(either: Either5[int, int, int, int, int]) -> int:
+    if isinstance(either, First):
+        return _inc(either.val)
+    elif isinstance(either, Second):
+        return _double_int(either.val)
+    elif isinstance(either, Third):
+        return _inc(either.val)
+    elif isinstance(either, Fourth):
+        return _double_int(either.val)
+    else:
+        return _inc(either.val)
+
+
+def run_either_isinstance(iterations: int) -> None:
+    for _ in range(iterations // 5):
+        for either in EITHERS:
+            _either_isinstance(either)
+
+
+def run_match_either(iterations: int) -> None:
+    handle = match_either(
+        first=_inc,
+        second=_double_int,
+        third=_inc,
+        fourth=_double_int,
+        fifth=_inc,
+    )
+    for _ in range(iterations // 5):
+        for either in EITHERS:
+            handle(either)
+
+
+# shallow enough for plain recursion
+_RECURSION_DEPTH = 500
+
+
+def _sum_to_recursive(n: int) -> Result[int, str]:
+    if n == 0:
+        return Ok(0)
+    return _sum_to_recursive(n - 1).flat_map(lambda total: Ok(total + n))
+
+
+def _sum_to_trampolined(n: int) -> Step[Result[int, str]]:
+    if n == 0:
+        return Ok(0)
+    return FlatMap(Bounce(lambda: _sum_to_trampolined(n - 1)), lambda t: Ok(t + n))
+
+
+def run_recursive_flat_map(iterations: int) -> None:
+    for _ in range(iterations // _RECURSION_DEPTH):
+        _sum_to_recursive(_RECURSION_DEPTH)
+
+
+def run_trampoline(iterations: int) -> None:
+    for _ in range(iterations // _RECURSION_DEPTH):
+        run(_sum_to_trampolined(_RECURSION_DEPTH))
+
+
+def _step(n: int) -> Result[int, str]:
+    return Ok(n + 1) if n >= 0 else Err("negative")
+
+
+def _flat_map_5(n: int) -> Result[int, str]:
+    return _step(n).flat_map(
+        lambda a: _step(a).flat_map(
+            lambda b: _step(b).flat_map(
+                lambda c: _step(c).flat_map(
+                    lambda d: _step(d).map(lambda e: a + b + c + d + e)
+                )
+            )
+        )
+    )
+
+
+@result_do
+def _do_5(n: int) -> Generator[Result[int, str], Any, int]:
+    a: int = yield _step(n)
+    b: int = yield _step(a)
+    c: int = yield _step(b)
+    d: int = yield _step(c)
+    e: int = yield _step(d)
+    return a + b + c + d + e
+
+
+def _flat_map_10(n: int) -> Result[int, str]:
+    return _step(n).flat_map(
+        lambda a: _step(a).flat_map(
+            lambda b: _step(b).flat_map(
+                lambda c: _step(c).flat_map(
+                    lambda d: _step(d).flat_map(
+                        lambda e: _step(e).flat_map(
+                            lambda f: _step(f).flat_map(
+                                lambda g: _step(g).flat_map(
+                                    lambda h: _step(h).flat_map(
+                                        lambda i: _step(i).map(
+                                            lambda j: sum(
+                                                (a, b, c, d, e, f, g, h, i, j)
+                                            )
+                                        )
+                                    )
+                                )
+                            )
+                        )
+                    )
+                )
+            )
+        )
+    )
+
+
+@result_do
+def _do_10(n: int) -> Generator[Result[int, str], Any, int]:
+    a: int = yield _step(n)
+    b: int = yield _step(a)
+    c: int = yield _step(b)
+    d: int = yield _step(c)
+    e: int = yield _step(d)
+    f: int = yield _step(e)
+    g: int = yield _step(f)
+    h: int = yield _step(g)
+    i: int = yield _step(h)
+    j: int = yield _step(i)
+    return sum((a, b, c, d, e, f, g, h, i, j))
+
+
+def run_flat_map_5(iterations: int) -> None:
+    for i in range(iterations):
+        # every 10th fails on the first step
+        _flat_map_5(-1 if i % 10 == 0 else i)
+
+
+def run_result_do_5(iterations: int) -> None:
+    for i in range(iterations):
+        _do_5(-1 if i % 10 == 0 else i)
+
+
+def run_flat_map_10(iterations: int) -> None:
+    for i in range(iterations):
+        _flat_map_10(-1 if i % 10 == 0 else i)
+
+
+def run_result_do_10(iterations: int) -> None:
+    for i in range(iterations):
+        _do_10(-1 if i % 10 == 0 else i)
+
+
+def run_set_of_containers(iterations: int) -> None:
+    containers = [Ok(i % 1000) for i in range(iterations)]
+    unique = set(containers)
+    for container in containers:
+        container in unique
+
+
+def run_dict_of_containers(iterations: int) -> None:
+    counts: Dict[Maybe[int], int] = {}
+    for i in range(iterations):
+        key = Just(i % 1000) if i % 3 else nothing
+        counts[key] = counts.get(key, 0) + 1
+
+
+_DEEP_PAYLOAD = tuple(range(100))
+
+
+def run_hash_deep_tuple(iterations: int) -> None:
+    payload = _DEEP_PAYLOAD
+    for _ in range(iterations):
+        hash(payload)
+
+
+def run_hash_deep_container(iterations: int) -> None:
+    # only the first `hash` goes through the payload
+    container = Ok(_DEEP_PAYLOAD)
+    for _ in range(iterations):
+        hash(container)
+
+
+def run_safe_try(iterations: int) -> None:
+    for i in range(iterations // 2):
+        safe_try(_inc, i)
+        safe_try(int, "not an int")
+
+
+def run_safe_try_ok(iterations: int) -> None:
+    for i in range(iterations):
+        safe_try(_inc, i)
+
+
+_safe_inc = returns_result()(_inc)
+_safe_int = returns_result(ValueError)(int)
+
+
+def run_returns_result(iterations: int) -> None:
+    for i in range(iterations // 2):
+        _safe_inc(i)
+        _safe_int("not an int")
+
+
+def run_returns_result_ok(iterations: int) -> None:
+    for i in range(iterations):
+        _safe_inc(i)
+
+
+@instrument.instrumented("bench")
+def _instrumented_half(n: int) -> Result[int, str]:
+    return _half(n)
+
+
+def run_instrumented_disabled(iterations: int) -> None:
+    for i in range(iterations):
+        _instrumented_half(i)
+
+
+def run_instrumented_enabled(iterations: int) -> None:
+    instrument.enable()
+    try:
+        for i in range(iterations // 2):
+            _instrumented_half(i)
+            safe_try(_inc, i)
+    finally:
+        instrument.disable()
+        instrument.reset()
+
+
+def run_load_once(iterations: int) -> None:
+    loaded = load_once(lambda: 5)
+    for _ in range(iterations):
+        loaded()
+
+
+def _floats(iterations: int) -> Iterator[Result[float, str]]:
+    for i in range(iterations):
+        yield Err("missing") if i % 100 == 0 else Ok(i / 3)
+
+
+def run_result_list_map(iterations: int) -> None:
+    results = list(_floats(iterations))
+    [result.map(_double) for result in results]
+
+
+def run_result_array_map(iterations: int) -> None:
+    ResultArray.from_results(_floats(iterations)).map(_double)
+
+
+def run_result_list_get_or_else(iterations: int) -> None:
+    results = list(_floats(iterations))
+    [result.get_or_else(0.0) for result in results]
+
+
+def run_result_array_get_or_else(iterations: int) -> None:
+    ResultArray.from_results(_floats(iterations)).get_or_else(0.0)
+
+
+def _sparse(iterations: int) -> Iterator[Optional[float]]:
+    for i in range(iterations):
+        yield i / 3 if i % 4 == 0 else None
+
+
+def run_maybe_list_map(iterations: int) -> None:
+    maybes = [to_maybe(val) for val in _sparse(iterations)]
+    [maybe.map(_double) for maybe in maybes]
+
+
+def run_maybe_array_map(iterations: int) -> None:
+    MaybeArray.from_optionals(_sparse(iterations)).map(_double)
+
+
+def _mixed_results(iterations: int) -> List[Result[int, str]]:
+    return [Ok(i) if i % 10 else Err("bad") for i in range(iterations)]
+
+
+def _all_ok(iterations: int) -> List[Result[int, str]]:
+    return [Ok(i) for i in range(iterations)]
+
+
+def run_collect_results(iterations: int) -> None:
+    collect_results(_all_ok(iterations))
+    collect_results(_mixed_results(iterations), accumulate=True)
+
+
+def run_collect_results_naive(iterations: int) -> None:
+    for results in [_all_ok(iterations), _mixed_results(iterations)]:
+        vals: List[int] = []
+        errs: List[str] = []
+        for result in results:
+            if result.is_ok:
+                vals.append(result.val)
+            else:
+                errs.append(result.val)
+
+
+def run_partition_results(iterations: int) -> None:
+    partition_results(_mixed_results(iterations))
+
+
+def run_partition_results_naive(iterations: int) -> None:
+    vals: List[int] = []
+    errs: List[str] = []
+    for result in _mixed_results(iterations):
+        if isinstance(result, Ok):
+            vals.append(result.val)
+        else:
+            errs.append(result.val)
+
+
+def _mixed_containers(iterations: int) -> List[Container]:
+    return [
+        Ok(i) if i % 3 else (Just(str(i)) if i % 2 else nothing)
+        for i in range(iterations)
+    ]
+
+
+def _pickled(iterations: int) -> bytes:
+    return pickle.dumps(_mixed_containers(iterations), pickle.HIGHEST_PROTOCOL)
+
+
+def _pickled_encoded(iterations: int) -> bytes:
+    return pickle.dumps(encode(_mixed_containers(iterations)), pickle.HIGHEST_PROTOCOL)
+
+
+def run_pickle_round_trip(iterations: int) -> None:
+    pickle.loads(_pickled(iterations))
+
+
+def run_pickle_encoded_round_trip(iterations: int) -> None:
+    decode(*pickle.loads(_pickled_encoded(iterations)))
+
+
+def _all_just(iterations: int) -> List[Maybe[int]]:
+    return [Just(i) for i in range(iterations)] + [nothing]
+
+
+def run_sequence_maybes(iterations: int) -> None:
+    sequence_maybes(_all_just(iterations))
+
+
+def run_sequence_maybes_naive(iterations: int) -> None:
+    vals: List[int] = []
+    for maybe in _all_just(iterations):
+        if isinstance(maybe, Just):
+            vals.append(maybe.val)
+        else:
+            break
+
+
+def run_results_to_maybes(iterations: int) -> None:
+    results_to_maybes(_mixed_results(iterations))
+
+
+def run_results_to_maybes_naive(iterations: int) -> None:
+    [result.to_maybe for result in _mixed_results(iterations)]
+
+
+def _sparse_maybes(iterations: int) -> List[Maybe[int]]:
+    return [Just(i) if i % 10 else nothing for i in range(iterations)]
+
+
+def run_maybes_to_results(iterations: int) -> None:
+    maybes_to_results(_sparse_maybes(iterations), "missing")
+
+
+def run_maybes_to_results_naive(iterations: int) -> None:
+    [maybe.to_result("missing") for maybe in _sparse_maybes(iterations)]
+
+
+def run_result_method_chain(iterations: int) -> None:
+    for i in range(iterations):
+        result: Result[int, str] = Ok(i)
+        result.map(_inc).flat_map(_non_negative).map(_inc).flat_map(_non_negative)
+
+
+def run_result_pipeline(iterations: int) -> None:
+    run = (
+        ResultPipeline[int, int, str]()
+        .map(_inc)
+        .flat_map(_non_negative)
+        .map(_inc)
+        .flat_map(_non_negative)
+        .compile()
+    )
+    for i in range(iterations):
+        run(Ok(i))
+
+
+def _compose_none_checks(
+    fn1: Callable[[Any], Any],
+    fn2: Callable[[Any], Any],
+    fn3: Optional[Callable[[Any], Any]] = None,
+    fn4: Optional[Callable[[Any], Any]] = None,
+    fn5: Optional[Callable[[Any], Any]] = None,
+    fn6: Optional[Callable[[Any], Any]] = None,
+    fn7: Optional[Callable[[Any], Any]] = None,
+    fn8: Optional[Callable[[Any], Any]] = None,
+) -> Callable[[Any], Any]:
+    """
+    The previous `compose`, which checks which functions were passed on each call
+    """
+
+    def inner(obj: Any) -> Any:
+        if fn3 is None:
+            return fn2(fn1(obj))
+        elif fn4 is None:
+            return fn3(fn2(fn1(obj)))
+        elif fn5 is None:
+            return fn4(fn3(fn2(fn1(obj))))
+        elif fn6 is None:
+            return fn5(fn4(fn3(fn2(fn1(obj)))))
+        elif fn7 is None:
+            return fn6(fn5(fn4(fn3(fn2(fn1(obj))))))
+        elif fn8 is None:
+            return fn7(fn6(fn5(fn4(fn3(fn2(fn1(obj)))))))
+        else:
+            return fn8(fn7(fn6(fn5(fn4(fn3(fn2(fn1(obj))))))))
+
+    return inner
+
+
+def run_compose_none_checks(iterations: int) -> None:
+    fn8 = _compose_none_checks(_inc, _inc, _inc, _inc, _inc, _inc, _inc, _inc)
+    fn16 = _compose_none_checks(fn8, fn8)
+    for i in range(iterations):
+        fn8(i)
+        fn16(i)
+
+
+def run_compose(iterations: int) -> None:
+    fn8 = compose(_inc, _inc, _inc, _inc, _inc, _inc, _inc, _inc)
+    fn16 = compose(fn8, fn8)
+    for i in range(iterations):
+        fn8(i)
+        fn16(i)
+
+
+def _parsed_lines(iterations: int) -> Iterator[Result[int, str]]:
+    for i in range(iterations):
+        yield Err("blank line") if i % 100 == 0 else Ok(i)
+
+
+def run_stream_flat(iterations: int) -> None:
+    stream = filter_ok(
+        flat_map_ok(map_ok(_parsed_lines(iterations), _inc), _non_negative)
+    )
+    deque(stream, maxlen=0)
+
+
+def run_stream_chunked(iterations: int) -> None:
+    chunks = chunked_collect(_parsed_lines(iterations), 1000, accumulate=True)
+    deque(chunks, maxlen=0)
+
+
+_json_format = JsonFormat()
+
+
+def run_json_lines(iterations: int) -> None:
+    with open(os.devnull, "w") as f:
+        _json_format.dump_lines(_parsed_lines(iterations), f)
+
+
+def run_json_lines_naive(iterations: int) -> None:
+    with open(os.devnull, "w") as f:
+        f.write(
+            json.dumps(list(_parsed_lines(iterations)), default=_json_format.default)
+        )
+
+
+def run_stream(iterations: int) -> None:
+    run_stream_flat(iterations)
+    run_stream_chunked(iterations)
+
+
+def _make_user(name: str, age: int, email: str) -> Dict[str, Any]:
+    return {"name": name, "age": age, "email": email}
+
+
+def run_validate_apply(iterations: int) -> None:
+    def curried(name: str) -> Callable[[int], Callable[[str], Dict[str, Any]]]:
+        return lambda age: lambda email: _make_user(name, age, email)
+
+    for i in range(iterations):
+        age: Result[int, str] = Ok(i) if i % 4 else Err("bad age")
+        Ok("a@b.c").apply(age.apply(Ok("name").map(curried)))
+
+
+def run_validate_map_n(iterations: int) -> None:
+    for i in range(iterations):
+        age: Result[int, str] = Ok(i) if i % 4 else Err("bad age")
+        map_n(_make_user, Ok("name"), age, Ok("a@b.c"))
+
+
+def run_validate(iterations: int) -> None:
+    for i in range(iterations):
+        age: Result[int, str] = Ok(i) if i % 4 else Err("bad age")
+        validate(Ok("name"), age, Ok("a@b.c"))
+
+
+benches: Dict[str, Callable[[int], None]] = {
+    "create_ok": create_ok,
+    "create_ok_of": create_ok_of,
+    "create_err": create_err,
+    "create_just": create_just,
+    "create_nothing": create_nothing,
+    "mapping_get": run_mapping_get,
+    "mapping_get_many": run_mapping_get_many,
+    "mapping_get_many_naive": run_mapping_get_many_naive,
+    "mapping_get_all": run_mapping_get_all,
+    "mapping_get_path": run_mapping_get_path,
+    "mapping_get_path_flat_map": run_mapping_get_path_flat_map,
+    "result_map": result_map,
+    "result_flat_map": result_flat_map,
+    "result_apply": result_apply,
+    "result_get_or_else": result_get_or_else,
+    "maybe_map": maybe_map,
+    "maybe_flat_map": maybe_flat_map,
+    "maybe_apply": maybe_apply,
+    "maybe_get_or_else": maybe_get_or_else,
+    "either_map": either_map,
+    "either_map_chain": run_either_map_chain,
+    "either_isinstance": run_either_isinstance,
+    "match_either": run_match_either,
+    "recursive_flat_map": run_recursive_flat_map,
+    "trampoline": run_trampoline,
+    "flat_map_5": run_flat_map_5,
+    "result_do_5": run_result_do_5,
+    "flat_map_10": run_flat_map_10,
+    "result_do_10": run_result_do_10,
+    "set_of_containers": run_set_of_containers,
+    "dict_of_containers": run_dict_of_containers,
+    "hash_deep_tuple": run_hash_deep_tuple,
+    "hash_deep_container": run_hash_deep_container,
+    "safe_try": run_safe_try,
+    "safe_try_ok": run_safe_try_ok,
+    "returns_result": run_returns_result,
+    "returns_result_ok": run_returns_result_ok,
+    "load_once": run_load_once,
+    "instrumented_disabled": run_instrumented_disabled,
+    "instrumented_enabled": run_instrumented_enabled,
+    "result_list_map": run_result_list_map,
+    "result_array_map": run_result_array_map,
+    "result_list_get_or_else": run_result_list_get_or_else,
+    "result_array_get_or_else": run_result_array_get_or_else,
+    "maybe_list_map": run_maybe_list_map,
+    "maybe_array_map": run_maybe_array_map,
+    "pickle_round_trip": run_pickle_round_trip,
+    "pickle_encoded_round_trip": run_pickle_encoded_round_trip,
+    "collect_results": run_collect_results,
+    "collect_results_naive": run_collect_results_naive,
+    "partition_results": run_partition_results,
+    "partition_results_naive": run_partition_results_naive,
+    "sequence_maybes": run_sequence_maybes,
+    "sequence_maybes_naive": run_sequence_maybes_naive,
+    "results_to_maybes": run_results_to_maybes,
+    "results_to_maybes_naive": run_results_to_maybes_naive,
+    "maybes_to_results": run_maybes_to_results,
+    "maybes_to_results_naive": run_maybes_to_results_naive,
+    "result_method_chain": run_result_method_chain,
+    "result_pipeline": run_result_pipeline,
+    "compose_none_checks": run_compose_none_checks,
+    "compose": run_compose,
+    "stream": run_stream,
+    "json_lines": run_json_lines,
+    "json_lines_naive": run_json_lines_naive,
+    "validate_apply": run_validate_apply,
+    "validate_map_n": run_validate_map_n,
+    "validate": run_validate,
+}
+
+# a shared payload, so only the containers themselves are measured
+_PAYLOAD: object = object()
+
+# one instance per call; see `measure_container` in bench/run.py
+containers: Dict[str, Callable[[], Any]] = {
+    "Ok": partial(Ok, _PAYLOAD),
+    "Err": partial(Err, _PAYLOAD),
+    "Just": partial(Just, _PAYLOAD),
+    "Nothing": Nothing,
+    "First": partial(First, _PAYLOAD),
+    "Second": partial(Second, _PAYLOAD),
+    "Third": partial(Third, _PAYLOAD),
+    "Fourth": partial(Fourth, _PAYLOAD),
+    "Fifth": partial(Fifth, _PAYLOAD),
+    # for comparison
+    "tuple": partial(tuple, [_PAYLOAD]),
+}
+
+# build a column of `iterations` items; see `measure_retained` in bench/run.py
+columns: Dict[str, Callable[[int], Any]] = {
+    "result_list": lambda iterations: list(_floats(iterations)),
+    "result_array": lambda iterations: ResultArray.from_results(_floats(iterations)),
+    "maybe_list": lambda iterations: [to_maybe(val) for val in _sparse(iterations)],
+    "maybe_array": lambda iterations: MaybeArray.from_optionals(_sparse(iterations)),
+}
+
+# serialize `iterations` items; the runner reports the size per item
+encodings: Dict[str, Callable[[int], bytes]] = {
+    "pickle": _pickled,
+    "pickle_encoded": _pickled_encoded,
+}
+
+# peak memory should stay flat regardless of `iterations`
+streams: Dict[str, Callable[[int], None]] = {
+    "stream_flat": run_stream_flat,
+    "stream_chunked": run_stream_chunked,
+    "json_lines": run_json_lines,
+    "json_lines_naive": run_json_lines_naive,
+}
+
+# statements run in a fresh interpreter; see `measure_import` in bench/run.py
+imports: Dict[str, str] = {
+    "import_koda": "import koda",
+    "import_ok": "from koda import Ok",
+    "import_everything": "from koda import *",
+    "import_serde": "import koda.serde",
+}
+
+if sys.version_info >= (3, 10):
+    from bench.cases_310 import run_either_match_statement
+
+    benches["either_match_statement"] = run_either_match_statement
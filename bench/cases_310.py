@@ -0,0 +1,21 @@
+"""
+Cases using syntax which needs python 3.10+.
+"""
+from bench.cases import EITHERS, _double_int, _inc
+from koda import Fifth, First, Fourth, Second, Third
+
+
+def run_either_match_statement(iterations: int) -> None:
+    for _ in range(iterations // 5):
+        for either in EITHERS:
+            match either:
+                case First(val):
+                    _inc(val)
+                case Second(val):
+                    _double_int(val)
+                case Third(val):
+                    _inc(val)
+                case Fourth(val):
+                    _double_int(val)
+                case Fifth(val):
+                    _inc(val)
@@ -1,76 +1,301 @@
-from argparse import ArgumentParser
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tracemalloc
+from argparse import ArgumentParser, Namespace
+from math import ceil
 from time import perf_counter
-from typing import Callable, Dict
+from typing import Any, Callable, Dict, List, Optional
 
-from koda import Err, Just, Nothing, Ok, mapping_get
+from bench.cases import benches, columns, containers, encodings, imports, streams
 
+Stats = Dict[str, float]
 
-def create_ok(iterations: int) -> None:
-    for i in range(iterations):
-        Ok(i)
 
+def time_bench(
+    fn: Callable[[int], None], iterations: int, warmup: int, repeat: int
+) -> List[float]:
+    """
+    Seconds taken by each of `repeat` timed runs, after `warmup` untimed ones.
+    """
+    for _ in range(warmup):
+        fn(iterations)
 
-def create_err(iterations: int) -> None:
-    for i in range(iterations):
-        Err(i)
+    times: List[float] = []
+    for _ in range(repeat):
+        # don't let garbage from the last run get collected during this one
+        gc.collect()
+        start = perf_counter()
+        fn(iterations)
+        times.append(perf_counter() - start)
+    return times
 
 
-def create_just(iterations: int) -> None:
-    for i in range(iterations):
-        Just(i)
+def _percentile(ordered: List[float], pct: float) -> float:
+    # nearest-rank, so the result is always one of the measured times
+    return ordered[max(ceil(pct / 100 * len(ordered)) - 1, 0)]
 
 
-def create_nothing(iterations: int) -> None:
-    for _ in range(iterations):
-        Nothing()
+def summarize(times: List[float], iterations: int) -> Stats:
+    """
+    Statistics over `times`, in nanoseconds per iteration.
+    """
+    per_iter = sorted(t * 1e9 / iterations for t in times)
+    return {
+        "median": statistics.median(per_iter),
+        "p90": _percentile(per_iter, 90),
+        "min": per_iter[0],
+        "max": per_iter[-1],
+        "stdev": statistics.stdev(per_iter) if len(per_iter) > 1 else 0.0,
+    }
 
 
-def run_mapping_get(iterations: int) -> None:
-    obj = {"a": 1, "b": 2, "c": 3}
-    for i in range(iterations // 2):
-        # misses
-        mapping_get(obj, "3")
-    for i in range(iterations // 2):
-        # hits
-        mapping_get(obj, "a")
+def compare(
+    results: Dict[str, Stats], baseline: Dict[str, Stats], threshold: float
+) -> List[str]:
+    """
+    Names of the benchmarks whose median is more than `threshold` (a fraction) slower
+    than in `baseline`. Benchmarks missing from either side are ignored.
+    """
+    regressions: List[str] = []
+    for name, stats in results.items():
+        if name in baseline:
+            limit = baseline[name]["median"] * (1 + threshold)
+            if stats["median"] > limit:
+                regressions.append(name)
+    return regressions
 
 
-benches: Dict[str, Callable[[int], None]] = {
-    "create_ok": create_ok,
-    "create_err": create_err,
-    "create_just": create_just,
-    "create_nothing": create_nothing,
-    "mapping_get": run_mapping_get,
-}
+def measure_container(factory: Callable[[], Any], count: int) -> float:
+    """
+    Traced bytes per instance made by `factory`, with `count` of them kept alive.
+    """
+    # allocated up front, so it isn't counted
+    keep: List[Any] = [None] * count
+    tracemalloc.start()
+    try:
+        for i in range(count):
+            keep[i] = factory()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / count
 
 
-def run_bench(iterations: int, fn: Callable[[int], None]) -> None:
-    start = perf_counter()
-    fn(iterations)
-    t_ = perf_counter() - start
-    print(f"Execution time: {t_:.4f} secs\n")
+def measure_peak(fn: Callable[[int], None], iterations: int) -> int:
+    """
+    Peak traced bytes while running `fn`.
+    """
+    tracemalloc.start()
+    try:
+        fn(iterations)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
 
 
-if __name__ == "__main__":
-    parser = ArgumentParser()
+def measure_retained(fn: Callable[[int], Any], iterations: int) -> float:
+    """
+    Traced bytes per item still held by what `fn` returns.
+    """
+    tracemalloc.start()
+    try:
+        kept = fn(iterations)  # noqa: F841
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / iterations
+
+
+def _import_times(statement: str) -> Dict[str, int]:
+    # the "self" microseconds of each module `-X importtime` reports
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    times: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:"):
+            label, _, module = line.split("|")
+            self_us = label.rsplit(":", 1)[1].strip()
+            if self_us.isdigit():
+                times[module.strip()] = int(self_us)
+    return times
+
+
+def measure_import(statement: str, repeat: int) -> List[float]:
+    """
+    Microseconds spent importing modules for `statement`, in each of `repeat` fresh
+    interpreters. Modules the interpreter imports at startup aren't counted.
+    """
+    startup = _import_times("pass")
+    times: List[float] = []
+    for _ in range(repeat):
+        module_times = _import_times(statement)
+        times.append(
+            sum(us for module, us in module_times.items() if module not in startup)
+        )
+    return times
+
+
+def _format_row(name: str, stats: Stats, baseline: Optional[Stats]) -> str:
+    row = (
+        f"{name:<28}{stats['median']:>12.1f}{stats['p90']:>12.1f}"
+        f"{stats['min']:>12.1f}{stats['max']:>12.1f}{stats['stdev']:>10.1f}"
+    )
+    if baseline is not None:
+        change = stats["median"] / baseline["median"] - 1
+        row += f"{change:>+10.1%}"
+    return row
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(description="Run koda's benchmarks")
+    parser.add_argument("names", nargs="*", help="benchmarks to run (default: all)")
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--json", metavar="PATH", help="write the results as JSON")
     parser.add_argument(
-        "tests",
-        type=str,
-        nargs="*",
-        help="which tests to run",
+        "--baseline", metavar="PATH", help="JSON results to compare against"
     )
     parser.add_argument(
-        "--iterations",
-        type=int,
-        default=1_000_000,
-        help="How many iterations of each test we'll run",
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="fail if a median is this fraction slower than the baseline",
+    )
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--memory",
+        action="store_true",
+        help="measure memory with tracemalloc instead of timing",
+    )
+    mode.add_argument(
+        "--imports",
+        action="store_true",
+        help="measure import times with -X importtime instead",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        available: Dict[str, Any] = {**containers, **columns, **encodings, **streams}
+    elif args.imports:
+        available = imports
+    else:
+        available = benches
+    unknown = [name for name in args.names if name not in available]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    if args.iterations < 1 or args.repeat < 1 or args.warmup < 0:
+        parser.error("iterations and repeat must be at least 1, warmup at least 0")
+
+    output: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "iterations": args.iterations,
+    }
+    if args.memory:
+        status = _run_memory(args.names, args.iterations, output)
+    elif args.imports:
+        output["repeat"] = args.repeat
+        status = _run_imports(args.names, args.repeat, output)
+    else:
+        output["repeat"] = args.repeat
+        status = _run_timing(args, output)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(output, f, indent=2)
+    return status
 
-    print(f"{args.iterations} ITERATIONS")
 
-    for name, fn in benches.items():
-        if args.tests == [] or name in args.tests:
-            print(f"----- BEGIN {name} -----\n")
-            run_bench(args.iterations, fn)
-            print(f"----- END {name} -----\n")
+def _run_timing(args: Namespace, output: Dict[str, Any]) -> int:
+    baseline: Dict[str, Stats] = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["benchmarks"]
+
+    print(
+        f"{'ns/iteration':<28}{'median':>12}{'p90':>12}{'min':>12}{'max':>12}"
+        f"{'stdev':>10}" + (f"{'change':>10}" if baseline else "")
+    )
+    results: Dict[str, Stats] = {}
+    for name in args.names or benches:
+        times = time_bench(benches[name], args.iterations, args.warmup, args.repeat)
+        results[name] = summarize(times, args.iterations)
+        print(_format_row(name, results[name], baseline.get(name)))
+    output["benchmarks"] = results
+
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(
+            f"Slower than the baseline by more than {args.threshold:.0%}: "
+            f"{', '.join(regressions)}"
+        )
+        return 1
+    return 0
+
+
+def _run_memory(names: List[str], iterations: int, output: Dict[str, Any]) -> int:
+    print(f"{'bytes/instance':<28}{'peak':>12}")
+    container_bytes: Dict[str, float] = {}
+    for name in containers:
+        if not names or name in names:
+            container_bytes[name] = measure_container(containers[name], iterations)
+            print(f"{name:<28}{container_bytes[name]:>12.1f}")
+
+    print(f"{'bytes/item':<28}{'retained':>12}")
+    column_bytes: Dict[str, float] = {}
+    for name in columns:
+        if not names or name in names:
+            column_bytes[name] = measure_retained(columns[name], iterations)
+            print(f"{name:<28}{column_bytes[name]:>12.1f}")
+
+    print(f"{'bytes/item':<28}{'encoded':>12}")
+    encoded_bytes: Dict[str, float] = {}
+    for name in encodings:
+        if not names or name in names:
+            encoded_bytes[name] = len(encodings[name](iterations)) / iterations
+            print(f"{name:<28}{encoded_bytes[name]:>12.1f}")
+
+    print(f"{'peak KiB':<28}{'peak':>12}")
+    stream_bytes: Dict[str, int] = {}
+    for name in streams:
+        if not names or name in names:
+            stream_bytes[name] = measure_peak(streams[name], iterations)
+            print(f"{name:<28}{stream_bytes[name] / 1024:>12.1f}")
+
+    output["containers"] = container_bytes
+    output["columns"] = column_bytes
+    output["encodings"] = encoded_bytes
+    output["streams"] = stream_bytes
+    return 0
+
+
+def _run_imports(names: List[str], repeat: int, output: Dict[str, Any]) -> int:
+    print(f"{'us/import':<28}{'median':>12}{'min':>12}{'max':>12}")
+    results: Dict[str, Dict[str, float]] = {}
+    for name in names or imports:
+        times = measure_import(imports[name], repeat)
+        results[name] = {
+            "median": statistics.median(times),
+            "min": min(times),
+            "max": max(times),
+        }
+        print(
+            f"{name:<28}{results[name]['median']:>12.0f}{results[name]['min']:>12.0f}"
+            f"{results[name]['max']:>12.0f}"
+        )
+    output["imports"] = results
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
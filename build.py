@@ -0,0 +1,58 @@
+"""
+Builds the optional `koda._speedups` C extension.
+
+Koda works without it, so a failed compile (no compiler, unsupported interpreter,
+etc.) only prints a warning, and setting `KODA_PURE_PYTHON` skips it entirely.
+
+For local development: `python build.py build_ext --inplace`
+"""
+import os
+import sys
+from typing import Any, Dict
+
+from setuptools import Extension
+from setuptools.command.build_ext import build_ext
+
+speedups = Extension("koda._speedups", sources=["koda/_speedups.c"])
+
+
+class OptionalBuildExt(build_ext):
+    def run(self) -> None:
+        try:
+            super().run()
+        except Exception as e:
+            self._warn(e)
+
+    def build_extension(self, ext: Extension) -> None:
+        try:
+            super().build_extension(ext)
+        except Exception as e:
+            self._warn(e)
+
+    @staticmethod
+    def _warn(e: Exception) -> None:
+        print(
+            f"WARNING: could not compile koda._speedups ({e!r}), "
+            "falling back to pure python",
+            file=sys.stderr,
+        )
+
+
+def build(setup_kwargs: Dict[str, Any]) -> None:
+    if os.environ.get("KODA_PURE_PYTHON"):
+        return
+
+    setup_kwargs.update(
+        {
+            "ext_modules": [speedups],
+            "cmdclass": {"build_ext": OptionalBuildExt},
+        }
+    )
+
+
+if __name__ == "__main__":
+    from setuptools import setup
+
+    setup_kwargs: Dict[str, Any] = {"name": "koda", "packages": ["koda"]}
+    build(setup_kwargs)
+    setup(**setup_kwargs)
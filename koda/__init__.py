@@ -1,28 +1,99 @@
-from koda.either import (
-    Either,
-    Either3,
-    Either4,
-    Either5,
-    Fifth,
-    First,
-    Fourth,
-    Second,
-    Third,
-)
-from koda.maybe import Just, Maybe, Nothing, nothing
-from koda.result import Err, Ok, Result
-from koda.utils import (
-    Thunk,
-    always,
-    compose,
-    identity,
-    load_once,
-    mapping_get,
-    safe_try,
-    thunkify,
-    to_maybe,
-    to_result,
-)
+"""
+Names are loaded from their submodules on first access (PEP 562), so that e.g.
+`from koda import Ok` doesn't import all of koda.
+"""
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:  # pragma: no cover
+    from koda.either import (
+        Either,
+        Either3,
+        Either4,
+        Either5,
+        Fifth,
+        First,
+        Fourth,
+        Second,
+        Third,
+    )
+    from koda.maybe import Just, Maybe, Nothing, nothing
+    from koda.result import Err, Ok, Result
+    from koda.utils import (
+        Thunk,
+        always,
+        compose,
+        identity,
+        load_once,
+        mapping_get,
+        mapping_get_all,
+        mapping_get_many,
+        mapping_get_path,
+        returns_result,
+        safe_try,
+        thunkify,
+        to_maybe,
+        to_result,
+    )
+
+_MODULES: Dict[str, str] = {
+    **dict.fromkeys(
+        [
+            "Either",
+            "Either3",
+            "Either4",
+            "Either5",
+            "First",
+            "Second",
+            "Third",
+            "Fourth",
+            "Fifth",
+        ],
+        "koda.either",
+    ),
+    **dict.fromkeys(["Maybe", "Just", "Nothing", "nothing"], "koda.maybe"),
+    **dict.fromkeys(["Result", "Ok", "Err"], "koda.result"),
+    **dict.fromkeys(
+        [
+            "always",
+            "compose",
+            "identity",
+            "mapping_get",
+            "mapping_get_many",
+            "mapping_get_all",
+            "mapping_get_path",
+            "load_once",
+            "safe_try",
+            "returns_result",
+            "to_maybe",
+            "to_result",
+            "Thunk",
+            "thunkify",
+        ],
+        "koda.utils",
+    ),
+}
+
+
+def _load(name: str) -> Any:
+    try:
+        module = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    val = getattr(import_module(module), name)
+    # later lookups don't go through `__getattr__`
+    globals()[name] = val
+    return val
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
+
+
+if not TYPE_CHECKING:  # pragma: no branch
+    # hidden from type checkers, which would otherwise accept any name at all
+    __getattr__ = _load
+
 
 __all__ = (
     "always",
@@ -45,8 +116,12 @@ __all__ = (
     "compose",
     "identity",
     "mapping_get",
+    "mapping_get_many",
+    "mapping_get_all",
+    "mapping_get_path",
     "load_once",
     "safe_try",
+    "returns_result",
     "to_maybe",
     "to_result",
     "Thunk",
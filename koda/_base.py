@@ -0,0 +1,69 @@
+import os
+from typing import TYPE_CHECKING, Any, Callable, Tuple, Type, TypeVar
+
+_T = TypeVar("_T", bound="_PyValBase")
+
+
+class _PyValBase:
+    """
+    Storage, construction, hashing and pickling for the immutable containers holding
+    a single `val`. The compiled `koda._speedups.ValBase` is used instead when it is
+    available.
+
+    Subclasses defining `__eq__` need to set `__hash__ = ValBase.__hash__`, since
+    python otherwise makes them unhashable.
+    """
+
+    __slots__ = ("val", "_hash")
+
+    val: Any
+    _hash: int
+
+    # `val` is only set here, with no `__init__`, so calling `__init__` again on an
+    # existing container is a no-op
+    def __new__(cls: Type[_T], val: Any) -> _T:
+        obj = _new_object(cls)
+        _set_val(obj, val)
+        return obj
+
+    if not TYPE_CHECKING:  # pragma: no branch
+        # hidden from type checkers, which would otherwise accept assigning any
+        # attribute at all
+
+        def __setattr__(self, name: str, value: Any) -> None:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+
+        def __delattr__(self, name: str) -> None:
+            raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __hash__(self) -> int:
+        # cached, since `val` may be expensive to hash
+        try:
+            return self._hash
+        except AttributeError:
+            val_hash = hash((type(self), self.val))
+            _set_hash(self, val_hash)
+            return val_hash
+
+    def __reduce__(self) -> Tuple[Type["_PyValBase"], Tuple[Any]]:
+        return self.__class__, (self.val,)
+
+
+_new_object = object.__new__
+# the slots' own setters, which get around `__setattr__` more cheaply than
+# `object.__setattr__`
+_set_val: Callable[[_PyValBase, Any], None] = _PyValBase.__dict__["val"].__set__
+_set_hash: Callable[[_PyValBase, int], None] = _PyValBase.__dict__["_hash"].__set__
+
+
+if TYPE_CHECKING:  # pragma: no cover
+    ValBase = _PyValBase
+elif os.environ.get("KODA_PURE_PYTHON"):  # pragma: no cover
+    ValBase = _PyValBase
+else:
+    try:
+        from koda._speedups import ValBase
+    except ImportError:  # pragma: no cover
+        ValBase = _PyValBase
+
+USING_SPEEDUPS: bool = ValBase is not _PyValBase
@@ -1,17 +1,100 @@
-from typing import Callable, Final, Optional, Union, cast, overload
+from typing import Any, Callable, Final, List, Sequence, Tuple, Union, cast, overload
+from weakref import WeakKeyDictionary
 
 from koda._generics import A, B, C, D, E, F, G, H, I
+from koda.instrument import _record_safe_try
+from koda.instrument import _state as _instrument_state
 from koda.result import Err, Ok, Result
 
 
+def _identity(x: A) -> A:
+    return x
+
+
+# the functions returned by `_compose` and what they're made of, so they can be
+# flattened into any `_compose` they are later passed to. Kept apart from the
+# functions themselves, since objects like mocks answer any attribute lookup
+_composed: Final[
+    "WeakKeyDictionary[Callable[[Any], Any], Tuple[Callable[[Any], Any], ...]]"
+] = WeakKeyDictionary()
+
+
+def _compose_flat(fns: Sequence[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    num_fns = len(fns)
+    if num_fns == 1:
+        return fns[0]
+    elif num_fns == 2:
+        fn1, fn2 = fns
+
+        def inner(obj: Any) -> Any:
+            return fn2(fn1(obj))
+
+    elif num_fns == 3:
+        fn1, fn2, fn3 = fns
+
+        def inner(obj: Any) -> Any:
+            return fn3(fn2(fn1(obj)))
+
+    elif num_fns == 4:
+        fn1, fn2, fn3, fn4 = fns
+
+        def inner(obj: Any) -> Any:
+            return fn4(fn3(fn2(fn1(obj))))
+
+    elif num_fns == 5:
+        fn1, fn2, fn3, fn4, fn5 = fns
+
+        def inner(obj: Any) -> Any:
+            return fn5(fn4(fn3(fn2(fn1(obj)))))
+
+    elif num_fns == 6:
+        fn1, fn2, fn3, fn4, fn5, fn6 = fns
+
+        def inner(obj: Any) -> Any:
+            return fn6(fn5(fn4(fn3(fn2(fn1(obj))))))
+
+    elif num_fns == 7:
+        fn1, fn2, fn3, fn4, fn5, fn6, fn7 = fns
+
+        def inner(obj: Any) -> Any:
+            return fn7(fn6(fn5(fn4(fn3(fn2(fn1(obj)))))))
+
+    elif num_fns == 8:
+        fn1, fn2, fn3, fn4, fn5, fn6, fn7, fn8 = fns
+
+        def inner(obj: Any) -> Any:
+            return fn8(fn7(fn6(fn5(fn4(fn3(fn2(fn1(obj))))))))
+
+    else:
+        # nested calls beat looping over the functions, so chain groups of 8
+        return _compose_flat(
+            [_compose_flat(fns[i : i + 8]) for i in range(0, num_fns, 8)]  # noqa: E203
+        )
+
+    return inner
+
+
+@overload
+def _compose() -> Callable[[A], A]:
+    ...  # pragma: no cover
+
+
+@overload
+def _compose(fn1: Callable[[A], B], /) -> Callable[[A], B]:
+    ...  # pragma: no cover
+
+
 @overload
-def _compose(fn1: Callable[[A], B], fn2: Callable[[B], C]) -> Callable[[A], C]:
+def _compose(fn1: Callable[[A], B], fn2: Callable[[B], C], /) -> Callable[[A], C]:
     ...  # pragma: no cover
 
 
 @overload
 def _compose(
-    fn1: Callable[[A], B], fn2: Callable[[B], C], fn3: Callable[[C], D]
+    fn1: Callable[[A], B],
+    fn2: Callable[[B], C],
+    fn3: Callable[[C], D],
+    /,
 ) -> Callable[[A], D]:
     ...  # pragma: no cover
 
@@ -22,6 +105,7 @@ def _compose(
     fn2: Callable[[B], C],
     fn3: Callable[[C], D],
     fn4: Callable[[D], E],
+    /,
 ) -> Callable[[A], E]:
     ...  # pragma: no cover
 
@@ -33,6 +117,7 @@ def _compose(
     fn3: Callable[[C], D],
     fn4: Callable[[D], E],
     fn5: Callable[[E], F],
+    /,
 ) -> Callable[[A], F]:
     ...  # pragma: no cover
 
@@ -45,6 +130,7 @@ def _compose(
     fn4: Callable[[D], E],
     fn5: Callable[[E], F],
     fn6: Callable[[F], G],
+    /,
 ) -> Callable[[A], G]:
     ...  # pragma: no cover
 
@@ -58,6 +144,7 @@ def _compose(
     fn5: Callable[[E], F],
     fn6: Callable[[F], G],
     fn7: Callable[[G], H],
+    /,
 ) -> Callable[[A], H]:
     ...  # pragma: no cover
 
@@ -72,37 +159,54 @@ def _compose(
     fn6: Callable[[F], G],
     fn7: Callable[[G], H],
     fn8: Callable[[H], I],
+    /,
 ) -> Callable[[A], I]:
     ...  # pragma: no cover
 
 
+# longer chains can't be checked, but mistyped shorter ones still fail to type-check
+@overload
 def _compose(
-    fn1: Callable[[A], B],
-    fn2: Callable[[B], C],
-    fn3: Optional[Callable[[C], D]] = None,
-    fn4: Optional[Callable[[D], E]] = None,
-    fn5: Optional[Callable[[E], F]] = None,
-    fn6: Optional[Callable[[F], G]] = None,
-    fn7: Optional[Callable[[G], H]] = None,
-    fn8: Optional[Callable[[H], I]] = None,
-) -> Callable[[A], Union[C, D, E, F, G, H, I]]:
-    def inner(obj: A) -> Union[C, D, E, F, G, H, I]:
-        if fn3 is None:
-            return fn2(fn1(obj))
-        elif fn4 is None:
-            return fn3(fn2(fn1(obj)))
-        elif fn5 is None:
-            return fn4(fn3(fn2(fn1(obj))))
-        elif fn6 is None:
-            return fn5(fn4(fn3(fn2(fn1(obj)))))
-        elif fn7 is None:
-            return fn6(fn5(fn4(fn3(fn2(fn1(obj))))))
-        elif fn8 is None:
-            return fn7(fn6(fn5(fn4(fn3(fn2(fn1(obj)))))))
-        else:
-            return fn8(fn7(fn6(fn5(fn4(fn3(fn2(fn1(obj))))))))
+    fn1: Callable[[Any], Any],
+    fn2: Callable[[Any], Any],
+    fn3: Callable[[Any], Any],
+    fn4: Callable[[Any], Any],
+    fn5: Callable[[Any], Any],
+    fn6: Callable[[Any], Any],
+    fn7: Callable[[Any], Any],
+    fn8: Callable[[Any], Any],
+    fn9: Callable[[Any], Any],
+    /,
+    *fns: Callable[[Any], Any],
+) -> Callable[[Any], Any]:
+    ...  # pragma: no cover
 
-    return inner
+
+def _compose(*fns: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    """
+    All the work of flattening nested compositions, dropping `identity` and picking
+    a call path is done here, once, rather than on each call of the returned function.
+    """
+    flat: List[Callable[[Any], Any]] = []
+    for fn in fns:
+        try:
+            composed_fns = _composed.get(fn)
+        except TypeError:
+            # unhashable or can't be weakly referenced, so not from `_compose`
+            composed_fns = None
+        if composed_fns is not None:
+            flat.extend(composed_fns)
+        elif fn is not _identity:
+            flat.append(fn)
+
+    if len(flat) == 0:
+        return _identity
+    elif len(flat) == 1:
+        return flat[0]
+    else:
+        composed = _compose_flat(flat)
+        _composed[composed] = tuple(flat)
+        return composed
 
 
 class _Unset:
@@ -171,6 +275,10 @@ def _safe_try(
     Result[F, Exception],
     Result[G, Exception],
 ]:
+    if _instrument_state.enabled:
+        args = [v for v in (v1, v2, v3, v4, v5, v6) if not isinstance(v, _Unset)]
+        return _record_safe_try(fn, *args)
+
     if isinstance(v2, _Unset):
         try:
             return Ok(cast(Callable[[A], B], fn)(v1))
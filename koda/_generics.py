@@ -13,3 +13,4 @@ J = TypeVar("J")
 K = TypeVar("K")
 
 FailT = TypeVar("FailT")
+ExcT = TypeVar("ExcT", bound=BaseException)
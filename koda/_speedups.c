@@ -0,0 +1,156 @@
+/*
+ * Optional compiled base for koda's single-value containers (`Ok`, `Err`, `Just`,
+ * `First`..`Fifth`). It only provides storage for `val` (read-only),
+ * construction, hashing and pickling; everything else stays in the python
+ * subclasses, so both backends share the same behavior. See `koda/_base.py` for the pure python equivalent.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <structmember.h>
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *val;
+    /* -1 until the hash is first computed */
+    Py_hash_t hash;
+} ValBaseObject;
+
+static int
+ValBase_traverse(ValBaseObject *self, visitproc visit, void *arg)
+{
+    Py_VISIT(self->val);
+    return 0;
+}
+
+static int
+ValBase_clear(ValBaseObject *self)
+{
+    Py_CLEAR(self->val);
+    return 0;
+}
+
+static void
+ValBase_dealloc(ValBaseObject *self)
+{
+    PyTypeObject *tp = Py_TYPE(self);
+    PyObject_GC_UnTrack(self);
+    ValBase_clear(self);
+    tp->tp_free((PyObject *)self);
+}
+
+static int
+ValBase_init(ValBaseObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"val", NULL};
+    PyObject *val;
+
+    if (kwds == NULL && PyTuple_GET_SIZE(args) == 1) {
+        val = PyTuple_GET_ITEM(args, 0);
+    }
+    else if (!PyArg_ParseTupleAndKeywords(args, kwds, "O:__init__", kwlist, &val)) {
+        return -1;
+    }
+    if (self->val != NULL) {
+        /* already initialised, so `val` is kept; like `_PyValBase`, where
+           `val` is only set in `__new__` */
+        return 0;
+    }
+    Py_INCREF(val);
+    self->val = val;
+    self->hash = -1;
+    return 0;
+}
+
+static Py_hash_t
+ValBase_hash(ValBaseObject *self)
+{
+    Py_hash_t val_hash;
+    Py_hash_t type_hash;
+    Py_uhash_t hash;
+
+    if (self->val == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "val");
+        return -1;
+    }
+    if (self->hash != -1) {
+        return self->hash;
+    }
+    val_hash = PyObject_Hash(self->val);
+    if (val_hash == -1) {
+        return -1;
+    }
+    /* include the type, so e.g. `Ok(1)` and `Err(1)` don't collide */
+    type_hash = PyObject_Hash((PyObject *)Py_TYPE(self));
+    if (type_hash == -1) {
+        return -1;
+    }
+    hash = (Py_uhash_t)val_hash ^ ((Py_uhash_t)type_hash * 1000003UL);
+    if (hash == (Py_uhash_t)-1) {
+        hash = (Py_uhash_t)-2;
+    }
+    self->hash = (Py_hash_t)hash;
+    return self->hash;
+}
+
+static PyObject *
+ValBase_reduce(ValBaseObject *self, PyObject *Py_UNUSED(ignored))
+{
+    if (self->val == NULL) {
+        PyErr_SetString(PyExc_AttributeError, "val");
+        return NULL;
+    }
+    return Py_BuildValue("O(O)", (PyObject *)Py_TYPE(self), self->val);
+}
+
+static PyMemberDef ValBase_members[] = {
+    {"val", T_OBJECT_EX, offsetof(ValBaseObject, val), READONLY, NULL},
+    {NULL}
+};
+
+static PyMethodDef ValBase_methods[] = {
+    {"__reduce__", (PyCFunction)ValBase_reduce, METH_NOARGS, NULL},
+    {NULL}
+};
+
+static PyTypeObject ValBaseType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    .tp_name = "koda._speedups.ValBase",
+    .tp_basicsize = sizeof(ValBaseObject),
+    .tp_itemsize = 0,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC,
+    .tp_new = PyType_GenericNew,
+    .tp_init = (initproc)ValBase_init,
+    .tp_hash = (hashfunc)ValBase_hash,
+    .tp_dealloc = (destructor)ValBase_dealloc,
+    .tp_traverse = (traverseproc)ValBase_traverse,
+    .tp_clear = (inquiry)ValBase_clear,
+    .tp_members = ValBase_members,
+    .tp_methods = ValBase_methods,
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    .m_name = "koda._speedups",
+    .m_size = -1,
+};
+
+PyMODINIT_FUNC
+PyInit__speedups(void)
+{
+    PyObject *module;
+
+    if (PyType_Ready(&ValBaseType) < 0) {
+        return NULL;
+    }
+    module = PyModule_Create(&speedups_module);
+    if (module == NULL) {
+        return NULL;
+    }
+    Py_INCREF(&ValBaseType);
+    if (PyModule_AddObject(module, "ValBase", (PyObject *)&ValBaseType) < 0) {
+        Py_DECREF(&ValBaseType);
+        Py_DECREF(module);
+        return NULL;
+    }
+    return module;
+}
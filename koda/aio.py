@@ -0,0 +1,168 @@
+import asyncio
+from functools import wraps
+from inspect import CORO_CREATED, getcoroutinestate, iscoroutine
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    overload,
+)
+
+from koda._generics import A, B, ExcT, FailT
+from koda.batch import collect_results
+from koda.result import Err, Ok, Result
+
+
+async def safe_try_async(
+    fn: Callable[..., Awaitable[A]], *args: Any, **kwargs: Any
+) -> Result[A, Exception]:
+    """
+    Like `safe_try`, but for coroutine functions: await `fn(*args, **kwargs)` and
+    return `Ok` of its value, or `Err` of any `Exception` it raises.
+    """
+    try:
+        return Ok(await fn(*args, **kwargs))
+    except Exception as e:
+        return Err(e)
+
+
+@overload
+def returns_result_async() -> (
+    Callable[
+        [Callable[..., Awaitable[A]]],
+        Callable[..., Awaitable[Result[A, Exception]]],
+    ]
+):
+    ...  # pragma: no cover
+
+
+@overload
+def returns_result_async(
+    exceptions: Union[Type[ExcT], Tuple[Type[ExcT], ...]]
+) -> Callable[[Callable[..., Awaitable[A]]], Callable[..., Awaitable[Result[A, ExcT]]]]:
+    ...  # pragma: no cover
+
+
+def returns_result_async(
+    exceptions: Union[Type[BaseException], Tuple[Type[BaseException], ...]] = Exception,
+) -> Callable[[Callable[..., Awaitable[A]]], Callable[..., Awaitable[Result[A, Any]]]]:
+    """
+    `koda.utils.returns_result` for coroutine functions. As there, the arguments of
+    the decorated function aren't type checked.
+    """
+
+    def decorator(
+        fn: Callable[..., Awaitable[A]]
+    ) -> Callable[..., Awaitable[Result[A, Any]]]:
+        @wraps(fn)
+        async def inner(*args: Any, **kwargs: Any) -> Result[A, Any]:
+            try:
+                return Ok(await fn(*args, **kwargs))
+            except exceptions as e:
+                return Err(e)
+
+        return inner
+
+    return decorator
+
+
+async def map_async(
+    result: Result[A, FailT], fn: Callable[[A], Awaitable[B]]
+) -> Result[B, FailT]:
+    if type(result) is Ok:
+        return Ok(await fn(result.val))
+    else:
+        return cast("Err[FailT]", result)
+
+
+async def flat_map_async(
+    result: Result[A, FailT], fn: Callable[[A], Awaitable[Result[B, FailT]]]
+) -> Result[B, FailT]:
+    if type(result) is Ok:
+        return await fn(result.val)
+    else:
+        return cast("Err[FailT]", result)
+
+
+async def _limited(semaphore: asyncio.Semaphore, awaitable: Awaitable[A]) -> A:
+    async with semaphore:
+        return await awaitable
+
+
+@overload
+async def gather_results(
+    awaitables: Iterable[Awaitable[Result[A, FailT]]],
+    *,
+    limit: Optional[int] = None,
+    accumulate: Literal[False] = False,
+) -> Result[List[A], FailT]:
+    ...  # pragma: no cover
+
+
+@overload
+async def gather_results(
+    awaitables: Iterable[Awaitable[Result[A, FailT]]],
+    *,
+    limit: Optional[int] = None,
+    accumulate: Literal[True],
+) -> Result[List[A], List[FailT]]:
+    ...  # pragma: no cover
+
+
+async def gather_results(
+    awaitables: Iterable[Awaitable[Result[A, FailT]]],
+    *,
+    limit: Optional[int] = None,
+    accumulate: bool = False,
+) -> Union[Result[List[A], FailT], Result[List[A], List[FailT]]]:
+    """
+    Run `awaitables` concurrently, with at most `limit` of them running at once, and
+    combine their `Result`s like `koda.batch.collect_results`, in input order.
+
+    By default, the first `Err` to arrive is returned and everything still pending is
+    cancelled. With `accumulate=True`, all the errors are collected instead.
+    An exception raised by any of the awaitables cancels the rest and is re-raised.
+    """
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be at least 1")
+
+    to_run = list(awaitables)
+    if limit is None:
+        tasks = [asyncio.ensure_future(awaitable) for awaitable in to_run]
+    else:
+        semaphore = asyncio.Semaphore(limit)
+        tasks = [
+            asyncio.ensure_future(_limited(semaphore, awaitable))
+            for awaitable in to_run
+        ]
+
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            result = await next_done
+            if not accumulate and type(result) is not Ok:
+                return cast("Err[FailT]", result)
+
+        results = [task.result() for task in tasks]
+        if accumulate:
+            return collect_results(results, True)
+        else:
+            return collect_results(results)
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        # coroutines still waiting on `limit` never started, so close them to avoid
+        # "never awaited" warnings
+        for awaitable in to_run:
+            if iscoroutine(awaitable) and getcoroutinestate(awaitable) == CORO_CREATED:
+                awaitable.close()
@@ -0,0 +1,309 @@
+"""
+Compact, columnar alternatives to lists of `Result`s and `Maybe`s, for large amounts
+of numeric data. Values are kept in an `array.array` rather than as one object per
+item, so a column of a million floats takes a few megabytes, and bulk operations
+loop in C where they can.
+"""
+from array import array
+from itertools import chain, compress, islice
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+    overload,
+)
+
+from koda._generics import FailT
+from koda.maybe import Just, Maybe, nothing
+from koda.result import Err, Ok, Result
+
+
+class ResultArray(Generic[FailT]):
+    """
+    A sequence of numeric `Ok`s and `Err`s, stored as an `array.array` of values
+    (`typecode` is as for `array.array`), a mask of which items are `Ok`, and a
+    mapping of index to error for the `Err`s. Err items hold 0 in `values`.
+
+    Instances are immutable; every operation returns a new array or `ResultArray`.
+    """
+
+    __slots__ = ("_values", "_ok_mask", "_errs")
+
+    def __init__(
+        self,
+        values: "array[Any]",
+        ok_mask: bytes,
+        errs: Mapping[int, FailT],
+    ) -> None:
+        if len(values) != len(ok_mask):
+            raise ValueError("values and ok_mask must be the same length")
+        self._values: "array[Any]" = values
+        self._ok_mask: bytes = ok_mask
+        self._errs: Mapping[int, FailT] = errs
+
+    @classmethod
+    def from_results(
+        cls, results: Iterable[Result[float, FailT]], typecode: str = "d"
+    ) -> "ResultArray[FailT]":
+        vals: List[float] = []
+        ok_mask = bytearray()
+        errs: Dict[int, FailT] = {}
+        for i, result in enumerate(results):
+            if type(result) is Ok:
+                vals.append(result.val)
+                ok_mask.append(1)
+            else:
+                vals.append(0)
+                ok_mask.append(0)
+                errs[i] = cast("Err[FailT]", result).val
+        return cls(array(typecode, vals), bytes(ok_mask), errs)
+
+    @classmethod
+    def from_values(
+        cls, values: Iterable[float], typecode: str = "d"
+    ) -> "ResultArray[FailT]":
+        """
+        All `Ok`s.
+        """
+        vals = array(typecode, values)
+        return cls(vals, bytes([1]) * len(vals), {})
+
+    @property
+    def values(self) -> "array[Any]":
+        """
+        The underlying values, including the 0s held by `Err` items. This supports
+        the buffer protocol, so e.g. `numpy.frombuffer` can use it without copying.
+        """
+        return self._values
+
+    @property
+    def ok_mask(self) -> bytes:
+        return self._ok_mask
+
+    @property
+    def errs(self) -> Mapping[int, FailT]:
+        return MappingProxyType(self._errs)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    @overload
+    def __getitem__(self, index: int) -> Result[float, FailT]:
+        ...  # pragma: no cover
+
+    @overload
+    def __getitem__(self, index: slice) -> "ResultArray[FailT]":
+        ...  # pragma: no cover
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Result[float, FailT], "ResultArray[FailT]"]:
+        if isinstance(index, slice):
+            # the positions taken, so errors can be renumbered to match
+            taken = range(len(self._values))[index]
+            return ResultArray(
+                self._values[index],
+                self._ok_mask[index],
+                {taken.index(i): err for i, err in self._errs.items() if i in taken},
+            )
+        if self._ok_mask[index]:
+            return Ok(self._values[index])
+        else:
+            # normalize negative indexes for the lookup
+            return Err(self._errs[range(len(self._values))[index]])
+
+    def __iter__(self) -> Iterator[Result[float, FailT]]:
+        errs = self._errs
+        for i, (val, ok) in enumerate(zip(self._values, self._ok_mask)):
+            yield Ok(val) if ok else Err(errs[i])
+
+    def __repr__(self) -> str:
+        return f"ResultArray({self.to_results()!r})"
+
+    def to_results(self) -> List[Result[float, FailT]]:
+        return list(self)
+
+    def map(
+        self, fn: Callable[[float], float], typecode: Optional[str] = None
+    ) -> "ResultArray[FailT]":
+        """
+        Call `fn` on each `Ok` value. The result has the same `typecode` unless
+        another is given.
+        """
+        typecode = self._values.typecode if typecode is None else typecode
+        if self._errs:
+            vals = array(
+                typecode,
+                [fn(val) if ok else 0 for val, ok in zip(self._values, self._ok_mask)],
+            )
+        else:
+            vals = array(typecode, map(fn, self._values))
+        return ResultArray(vals, self._ok_mask, self._errs)
+
+    def filter_ok(self) -> "array[Any]":
+        """
+        Just the `Ok` values.
+        """
+        if self._errs:
+            return array(self._values.typecode, compress(self._values, self._ok_mask))
+        else:
+            return array(self._values.typecode, self._values)
+
+    def get_or_else(self, fallback: float) -> "array[Any]":
+        """
+        The values, with `fallback` in place of each `Err`.
+        """
+        vals = array(self._values.typecode, self._values)
+        for i in self._errs:
+            vals[i] = fallback
+        return vals
+
+
+# for each byte of a bitmap, whether each of its 8 bits is set, least significant
+# bit first
+_BITS: Tuple[Tuple[bool, ...], ...] = tuple(
+    [tuple([bool(byte >> bit & 1) for bit in range(8)]) for byte in range(256)]
+)
+
+
+def _unpack_bits(bitmap: bytes) -> Iterator[bool]:
+    return chain.from_iterable(map(_BITS.__getitem__, bitmap))
+
+
+class MaybeArray:
+    """
+    A sequence of numeric `Just`s and `Nothing`s, stored as an `array.array` of
+    values (`typecode` is as for `array.array`) and a bitmap of which are present.
+    Missing items hold 0 in `values`. `Just`s and `Nothing`s are only made when
+    items are accessed one at a time.
+
+    Instances are immutable; every operation returns a new array or `MaybeArray`.
+    """
+
+    __slots__ = ("_values", "_bitmap", "_count")
+
+    def __init__(self, values: "array[Any]", bitmap: bytes) -> None:
+        if len(bitmap) != (len(values) + 7) // 8:
+            raise ValueError("bitmap must have one bit for each of values")
+        self._values: "array[Any]" = values
+        self._bitmap: bytes = bitmap
+        self._count: int = sum(islice(self._flags(), len(values)))
+
+    @classmethod
+    def from_optionals(
+        cls, optionals: Iterable[Optional[float]], typecode: str = "d"
+    ) -> "MaybeArray":
+        vals: List[float] = []
+        bitmap = bytearray()
+        byte = 0
+        for i, val in enumerate(optionals):
+            bit = i & 7
+            if bit == 0 and i:
+                bitmap.append(byte)
+                byte = 0
+            if val is None:
+                vals.append(0)
+            else:
+                vals.append(val)
+                byte |= 1 << bit
+        if vals:
+            bitmap.append(byte)
+        return cls(array(typecode, vals), bytes(bitmap))
+
+    @classmethod
+    def from_maybes(
+        cls, maybes: Iterable[Maybe[float]], typecode: str = "d"
+    ) -> "MaybeArray":
+        return cls.from_optionals(
+            [maybe.val if type(maybe) is Just else None for maybe in maybes],
+            typecode,
+        )
+
+    def _flags(self) -> Iterator[bool]:
+        # padding bits past the end are cut off by zipping with the values
+        return _unpack_bits(self._bitmap)
+
+    @property
+    def values(self) -> "array[Any]":
+        """
+        The underlying values, including the 0s held by missing items.
+        """
+        return self._values
+
+    @property
+    def bitmap(self) -> bytes:
+        return self._bitmap
+
+    def count(self) -> int:
+        """
+        The number of items which are present.
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __getitem__(self, index: int) -> Maybe[float]:
+        # normalize negative indexes for the bit lookup
+        index = range(len(self._values))[index]
+        if self._bitmap[index >> 3] >> (index & 7) & 1:
+            return Just(self._values[index])
+        else:
+            return nothing
+
+    def __iter__(self) -> Iterator[Maybe[float]]:
+        for val, present in zip(self._values, self._flags()):
+            yield Just(val) if present else nothing
+
+    def __repr__(self) -> str:
+        return f"MaybeArray({self.to_optional()!r})"
+
+    def to_maybes(self) -> List[Maybe[float]]:
+        return list(self)
+
+    def to_optional(self) -> List[Optional[float]]:
+        return [
+            val if present else None
+            for val, present in zip(self._values, self._flags())
+        ]
+
+    def map(
+        self, fn: Callable[[float], float], typecode: Optional[str] = None
+    ) -> "MaybeArray":
+        """
+        Call `fn` on each present value. The result has the same `typecode` unless
+        another is given.
+        """
+        typecode = self._values.typecode if typecode is None else typecode
+        if self._count == len(self._values):
+            vals = array(typecode, map(fn, self._values))
+        else:
+            vals = array(
+                typecode,
+                [
+                    fn(val) if present else 0
+                    for val, present in zip(self._values, self._flags())
+                ],
+            )
+        return MaybeArray(vals, self._bitmap)
+
+    def get_or_else(self, fallback: float) -> "array[Any]":
+        """
+        The values, with `fallback` in place of each missing item.
+        """
+        vals = array(self._values.typecode, self._values)
+        if self._count != len(vals):
+            for i, present in zip(range(len(vals)), self._flags()):
+                if not present:
+                    vals[i] = fallback
+        return vals
@@ -0,0 +1,281 @@
+from typing import Any, Callable, Iterable, List, Literal, Tuple, Union, cast, overload
+
+from koda._generics import A, B, C, D, E, F, FailT
+from koda.maybe import Just, Maybe, Nothing, nothing
+from koda.result import Err, Ok, Result
+
+
+@overload
+def collect_results(
+    results: Iterable[Result[A, FailT]],
+) -> Result[List[A], FailT]:
+    ...  # pragma: no cover
+
+
+@overload
+def collect_results(
+    results: Iterable[Result[A, FailT]], accumulate: Literal[False]
+) -> Result[List[A], FailT]:
+    ...  # pragma: no cover
+
+
+@overload
+def collect_results(
+    results: Iterable[Result[A, FailT]], accumulate: Literal[True]
+) -> Result[List[A], List[FailT]]:
+    ...  # pragma: no cover
+
+
+def collect_results(
+    results: Iterable[Result[A, FailT]], accumulate: bool = False
+) -> Union[Result[List[A], FailT], Result[List[A], List[FailT]]]:
+    """
+    Turn many `Result`s into a single `Result` of a list, in a single pass.
+
+    By default the first `Err` is returned as-is, and the rest of `results` is not
+    consumed. With `accumulate=True`, every error is collected into an `Err` of a list.
+    """
+    vals: List[A] = []
+    append_val = vals.append
+    if accumulate:
+        errs: List[FailT] = []
+        append_err = errs.append
+        for result in results:
+            if type(result) is Ok:
+                append_val(result.val)
+            else:
+                append_err(cast("Err[FailT]", result).val)
+        if errs:
+            return Err(errs)
+        else:
+            return Ok(vals)
+    else:
+        for result in results:
+            if type(result) is Ok:
+                append_val(result.val)
+            else:
+                return cast("Err[FailT]", result)
+        return Ok(vals)
+
+
+def partition_results(
+    results: Iterable[Result[A, FailT]]
+) -> Tuple[List[A], List[FailT]]:
+    """
+    Split the values of `Ok`s and `Err`s into two lists, preserving order.
+    """
+    vals: List[A] = []
+    errs: List[FailT] = []
+    append_val = vals.append
+    append_err = errs.append
+    for result in results:
+        if type(result) is Ok:
+            append_val(result.val)
+        else:
+            append_err(cast("Err[FailT]", result).val)
+    return vals, errs
+
+
+def sequence_maybes(maybes: Iterable[Maybe[A]]) -> Maybe[List[A]]:
+    """
+    `Just` a list of all the values, or `Nothing` if any `Maybe` is `Nothing`.
+    """
+    vals: List[A] = []
+    append_val = vals.append
+    for maybe in maybes:
+        if type(maybe) is Just:
+            append_val(maybe.val)
+        else:
+            return cast(Nothing, maybe)
+    return Just(vals)
+
+
+def results_to_maybes(results: Iterable[Result[A, Any]]) -> List[Maybe[A]]:
+    """
+    `result.to_maybe` for each of `results`, in a single pass.
+    """
+    return [Just(result.val) if type(result) is Ok else nothing for result in results]
+
+
+def maybes_to_results(
+    maybes: Iterable[Maybe[A]], fail_obj: FailT
+) -> List[Result[A, FailT]]:
+    """
+    `maybe.to_result(fail_obj)` for each of `maybes`, in a single pass. Every
+    `Nothing` becomes the same `Err`, which is safe since it's immutable.
+    """
+    err: Result[A, FailT] = Err(fail_obj)
+    return [Ok(maybe.val) if type(maybe) is Just else err for maybe in maybes]
+
+
+@overload
+def validate() -> Result[Tuple[()], Tuple[Any, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def validate(r1: Result[A, FailT], /) -> Result[Tuple[A], Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def validate(
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    /,
+) -> Result[Tuple[A, B], Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def validate(
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    r3: Result[C, FailT],
+    /,
+) -> Result[Tuple[A, B, C], Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def validate(
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    r3: Result[C, FailT],
+    r4: Result[D, FailT],
+    /,
+) -> Result[Tuple[A, B, C, D], Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def validate(
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    r3: Result[C, FailT],
+    r4: Result[D, FailT],
+    r5: Result[E, FailT],
+    /,
+) -> Result[Tuple[A, B, C, D, E], Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+# longer calls can't be checked per position, but shorter ones still are
+@overload
+def validate(
+    r1: Result[Any, FailT],
+    r2: Result[Any, FailT],
+    r3: Result[Any, FailT],
+    r4: Result[Any, FailT],
+    r5: Result[Any, FailT],
+    r6: Result[Any, FailT],
+    /,
+    *results: Result[Any, FailT],
+) -> Result[Tuple[Any, ...], Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+def validate(
+    *results: Result[Any, FailT]
+) -> Result[Tuple[Any, ...], Tuple[FailT, ...]]:
+    """
+    Combine `Result`s, keeping every error rather than stopping at the first one.
+
+    `Ok` of a tuple of all the values if every result is `Ok`, otherwise `Err` of a
+    tuple of all the errors, in order.
+    """
+    for result in results:
+        if type(result) is not Ok:
+            return Err(tuple([r.val for r in results if type(r) is not Ok]))
+    return Ok(tuple([r.val for r in results]))
+
+
+@overload
+def map_n(fn: Callable[[], F], /) -> Result[F, Tuple[Any, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def map_n(
+    fn: Callable[[A], F],
+    r1: Result[A, FailT],
+    /,
+) -> Result[F, Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def map_n(
+    fn: Callable[[A, B], F],
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    /,
+) -> Result[F, Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def map_n(
+    fn: Callable[[A, B, C], F],
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    r3: Result[C, FailT],
+    /,
+) -> Result[F, Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def map_n(
+    fn: Callable[[A, B, C, D], F],
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    r3: Result[C, FailT],
+    r4: Result[D, FailT],
+    /,
+) -> Result[F, Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def map_n(
+    fn: Callable[[A, B, C, D, E], F],
+    r1: Result[A, FailT],
+    r2: Result[B, FailT],
+    r3: Result[C, FailT],
+    r4: Result[D, FailT],
+    r5: Result[E, FailT],
+    /,
+) -> Result[F, Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+@overload
+def map_n(
+    fn: Callable[..., F],
+    r1: Result[Any, FailT],
+    r2: Result[Any, FailT],
+    r3: Result[Any, FailT],
+    r4: Result[Any, FailT],
+    r5: Result[Any, FailT],
+    r6: Result[Any, FailT],
+    /,
+    *results: Result[Any, FailT],
+) -> Result[F, Tuple[FailT, ...]]:
+    ...  # pragma: no cover
+
+
+def map_n(
+    fn: Callable[..., F], *results: Result[Any, FailT]
+) -> Result[F, Tuple[FailT, ...]]:
+    """
+    Call `fn` once with the values of `results` if they are all `Ok`. Otherwise
+    return `Err` of a tuple of all the errors, like `validate`.
+
+    This is the accumulating counterpart to chaining `Ok.apply` (which stops at the
+    first `Err`), without building up partially applied functions.
+    """
+    for result in results:
+        if type(result) is not Ok:
+            return Err(tuple([r.val for r in results if type(r) is not Ok]))
+    return Ok(fn(*[r.val for r in results]))
@@ -0,0 +1,190 @@
+import asyncio
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import (
+    Awaitable,
+    Callable,
+    Final,
+    Generic,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
+
+from koda._generics import A, B
+from koda.result import Err
+from koda.utils import Thunk
+
+
+class LoadOnce(Generic[A]):
+    """
+    A thread-safe alternative to `load_once`.
+
+    Concurrent callers wait for a single call of `fn`, rather than each calling it.
+    If `ttl` (in seconds) is given, the value is loaded again once it's that old.
+    `invalidate` drops the value, so the next call loads it again.
+    """
+
+    __slots__ = ("_fn", "_ttl", "_clock", "_lock", "_loaded")
+
+    def __init__(
+        self,
+        fn: Thunk[A],
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._fn: Thunk[A] = fn
+        self._ttl: Optional[float] = ttl
+        self._clock: Callable[[], float] = clock
+        self._lock: threading.Lock = threading.Lock()
+        # the value and when it was loaded are kept together, so they can be
+        # read without taking the lock
+        self._loaded: Optional[Tuple[A, float]] = None
+
+    def _is_fresh(self, loaded_at: float) -> bool:
+        return self._ttl is None or self._clock() - loaded_at < self._ttl
+
+    def __call__(self) -> A:
+        loaded = self._loaded
+        if loaded is not None and self._is_fresh(loaded[1]):
+            return loaded[0]
+
+        with self._lock:
+            loaded = self._loaded
+            if loaded is not None and self._is_fresh(loaded[1]):
+                return loaded[0]
+            val = self._fn()
+            self._loaded = (val, self._clock())
+            return val
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded = None
+
+
+class AsyncLoadOnce(Generic[A]):
+    """
+    `LoadOnce` for coroutine functions: concurrent awaiters share a single call of
+    `fn`.
+    """
+
+    __slots__ = ("_fn", "_ttl", "_clock", "_lock", "_loaded")
+
+    def __init__(
+        self,
+        fn: Callable[[], Awaitable[A]],
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._fn: Callable[[], Awaitable[A]] = fn
+        self._ttl: Optional[float] = ttl
+        self._clock: Callable[[], float] = clock
+        # created on first use, so it belongs to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+        self._loaded: Optional[Tuple[A, float]] = None
+
+    def _is_fresh(self, loaded_at: float) -> bool:
+        return self._ttl is None or self._clock() - loaded_at < self._ttl
+
+    async def __call__(self) -> A:
+        loaded = self._loaded
+        if loaded is not None and self._is_fresh(loaded[1]):
+            return loaded[0]
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            loaded = self._loaded
+            if loaded is not None and self._is_fresh(loaded[1]):
+                return loaded[0]
+            val = await self._fn()
+            self._loaded = (val, self._clock())
+            return val
+
+    def invalidate(self) -> None:
+        self._loaded = None
+
+
+_missing: Final[object] = object()
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class Memoized(Generic[A, B]):
+    """
+    Caches the return values of a single-argument function, evicting the least
+    recently used once there are more than `maxsize`. `Err` return values are not
+    cached unless `cache_errs` is set, so failures are retried.
+    """
+
+    __slots__ = (
+        "_fn",
+        "_maxsize",
+        "_cache_errs",
+        "_cache",
+        "_lock",
+        "_hits",
+        "_misses",
+    )
+
+    def __init__(
+        self,
+        fn: Callable[[A], B],
+        maxsize: Optional[int] = 128,
+        cache_errs: bool = False,
+    ) -> None:
+        self._fn: Callable[[A], B] = fn
+        self._maxsize: Optional[int] = maxsize
+        self._cache_errs: bool = cache_errs
+        self._cache: "OrderedDict[A, B]" = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def __call__(self, arg: A) -> B:
+        with self._lock:
+            cached = self._cache.get(arg, _missing)
+            if cached is not _missing:
+                self._hits += 1
+                self._cache.move_to_end(arg)
+                return cast(B, cached)
+            self._misses += 1
+
+        val = self._fn(arg)
+        if self._cache_errs or type(val) is not Err:
+            with self._lock:
+                self._cache[arg] = val
+                if self._maxsize is not None and len(self._cache) > self._maxsize:
+                    self._cache.popitem(last=False)
+        return val
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def memoize(
+    maxsize: Optional[int] = 128, cache_errs: bool = False
+) -> Callable[[Callable[[A], B]], Memoized[A, B]]:
+    """
+    Decorator version of `Memoized`; `maxsize=None` means the cache is unbounded.
+    """
+
+    def decorator(fn: Callable[[A], B]) -> Memoized[A, B]:
+        return Memoized(fn, maxsize, cache_errs)
+
+    return decorator
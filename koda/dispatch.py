@@ -0,0 +1,150 @@
+"""
+Build a function that handles each variant of an `Either`, `Result` or `Maybe`.
+Handlers are checked when the function is built, and each call is a single lookup
+by type, rather than a chain of `isinstance` checks or `map_*` calls.
+"""
+from typing import Any, Callable, Dict, Optional, Type, overload
+
+from koda._generics import A, B, C, D, E, F, FailT
+from koda.either import (
+    Either,
+    Either3,
+    Either4,
+    Either5,
+    Fifth,
+    First,
+    Fourth,
+    Second,
+    Third,
+)
+from koda.maybe import Just, Maybe, Nothing
+from koda.result import Err, Ok, Result
+
+
+def _check_handlers(
+    handlers: Dict[str, Optional[Callable[..., Any]]], required: int
+) -> None:
+    missing = False
+    for i, (name, handler) in enumerate(handlers.items()):
+        if handler is None:
+            if i < required:
+                raise TypeError(f"a handler for `{name}` is required")
+            missing = True
+        elif missing:
+            raise TypeError(
+                f"`{name}` was given, so the variants before it need handlers"
+            )
+        elif not callable(handler):
+            raise TypeError(f"`{name}` must be callable")
+
+
+def _by_type(handlers: Dict[Type[Any], Callable[[Any], F]]) -> Callable[[Any], F]:
+    def dispatch(value: Any) -> F:
+        try:
+            handler = handlers[type(value)]
+        except KeyError:
+            raise TypeError(f"no handler for {type(value).__name__}") from None
+        return handler(value.val)
+
+    return dispatch
+
+
+@overload
+def match_either(
+    *, first: Callable[[A], F], second: Callable[[B], F]
+) -> Callable[[Either[A, B]], F]:
+    ...  # pragma: no cover
+
+
+@overload
+def match_either(
+    *, first: Callable[[A], F], second: Callable[[B], F], third: Callable[[C], F]
+) -> Callable[[Either3[A, B, C]], F]:
+    ...  # pragma: no cover
+
+
+@overload
+def match_either(
+    *,
+    first: Callable[[A], F],
+    second: Callable[[B], F],
+    third: Callable[[C], F],
+    fourth: Callable[[D], F],
+) -> Callable[[Either4[A, B, C, D]], F]:
+    ...  # pragma: no cover
+
+
+@overload
+def match_either(
+    *,
+    first: Callable[[A], F],
+    second: Callable[[B], F],
+    third: Callable[[C], F],
+    fourth: Callable[[D], F],
+    fifth: Callable[[E], F],
+) -> Callable[[Either5[A, B, C, D, E]], F]:
+    ...  # pragma: no cover
+
+
+def match_either(
+    *,
+    first: Callable[[Any], F],
+    second: Callable[[Any], F],
+    third: Optional[Callable[[Any], F]] = None,
+    fourth: Optional[Callable[[Any], F]] = None,
+    fifth: Optional[Callable[[Any], F]] = None,
+) -> Callable[[Any], F]:
+    """
+    A function calling the handler for whichever variant it's given with its value.
+    The handlers given determine whether it handles `Either`, `Either3`, `Either4`
+    or `Either5`, so they must be contiguous from `first`.
+    """
+    _check_handlers(
+        {
+            "first": first,
+            "second": second,
+            "third": third,
+            "fourth": fourth,
+            "fifth": fifth,
+        },
+        2,
+    )
+    handlers: Dict[Type[Any], Callable[[Any], F]] = {First: first, Second: second}
+    if third is not None:
+        handlers[Third] = third
+    if fourth is not None:
+        handlers[Fourth] = fourth
+    if fifth is not None:
+        handlers[Fifth] = fifth
+    return _by_type(handlers)
+
+
+def match_result(
+    *, ok: Callable[[A], B], err: Callable[[FailT], B]
+) -> Callable[[Result[A, FailT]], B]:
+    """
+    A function calling `ok` with the value of an `Ok`, or `err` with that of an
+    `Err`.
+    """
+    _check_handlers({"ok": ok, "err": err}, 2)
+    return _by_type({Ok: ok, Err: err})
+
+
+def match_maybe(
+    *, just: Callable[[A], B], nothing: Callable[[], B]
+) -> Callable[[Maybe[A]], B]:
+    """
+    A function calling `just` with the value of a `Just`, or `nothing` for a
+    `Nothing`.
+    """
+    _check_handlers({"just": just, "nothing": nothing}, 2)
+
+    def dispatch(maybe: Maybe[A]) -> B:
+        # with only two variants, type checks are cheaper than a lookup
+        if type(maybe) is Just:
+            return just(maybe.val)
+        elif type(maybe) is Nothing:
+            return nothing()
+        raise TypeError(f"no handler for {type(maybe).__name__}")
+
+    return dispatch
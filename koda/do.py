@@ -0,0 +1,63 @@
+"""
+Generator-based alternatives to nested `flat_map`s. In a function decorated with
+`result_do`, `val = yield result` gives the value of an `Ok`, and an `Err` is
+returned straight away. The generator's return value is wrapped in `Ok`:
+
+    @result_do
+    def make_user(data: Dict[str, str]) -> Generator[Result[Any, str], Any, User]:
+        name: str = yield parse_name(data)
+        age: int = yield parse_age(data)
+        return User(name, age)
+
+`maybe_do` does the same for `Maybe`s.
+"""
+from functools import wraps
+from typing import Any, Callable, Generator
+
+from koda._generics import A, FailT
+from koda.maybe import Just, Maybe, Nothing, nothing
+from koda.result import Err, Ok, Result
+
+
+def result_do(
+    fn: Callable[..., Generator[Result[Any, FailT], Any, A]]
+) -> Callable[..., Result[A, FailT]]:
+    @wraps(fn)
+    def inner(*args: Any, **kwargs: Any) -> Result[A, FailT]:
+        gen = fn(*args, **kwargs)
+        send = gen.send
+        try:
+            result = send(None)
+            while type(result) is Ok:
+                result = send(result.val)
+        except StopIteration as stop:
+            return Ok(stop.value)
+
+        gen.close()
+        if type(result) is Err:
+            return result
+        raise TypeError(f"expected a Result, got {result!r}")
+
+    return inner
+
+
+def maybe_do(
+    fn: Callable[..., Generator[Maybe[Any], Any, A]]
+) -> Callable[..., Maybe[A]]:
+    @wraps(fn)
+    def inner(*args: Any, **kwargs: Any) -> Maybe[A]:
+        gen = fn(*args, **kwargs)
+        send = gen.send
+        try:
+            maybe = send(None)
+            while type(maybe) is Just:
+                maybe = send(maybe.val)
+        except StopIteration as stop:
+            return Just(stop.value)
+
+        gen.close()
+        if type(maybe) is Nothing:
+            return nothing
+        raise TypeError(f"expected a Maybe, got {maybe!r}")
+
+    return inner
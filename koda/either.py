@@ -1,18 +1,26 @@
-from typing import Any, Callable, Generic, Union
+from typing import TYPE_CHECKING, Any, Callable, Generic, Union
 
+from koda._base import ValBase
 from koda._generics import A, B, C, D, E
 
 
-class First(Generic[A]):
-    __slots__ = ("val",)
+class First(ValBase, Generic[A]):
+    __slots__ = ()
     __match_args__ = ("val",)
 
-    def __init__(self, val: A) -> None:
-        self.val: A = val
+    val: A
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: A) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, First) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"First({repr(self.val)})"
 
@@ -32,16 +40,23 @@ class First(Generic[A]):
         return self
 
 
-class Second(Generic[A]):
-    __slots__ = ("val",)
+class Second(ValBase, Generic[A]):
+    __slots__ = ()
     __match_args__ = ("val",)
 
-    def __init__(self, val: A) -> None:
-        self.val: A = val
+    val: A
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: A) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Second) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"Second({repr(self.val)})"
 
@@ -61,16 +76,23 @@ class Second(Generic[A]):
         return self
 
 
-class Third(Generic[A]):
-    __slots__ = ("val",)
+class Third(ValBase, Generic[A]):
+    __slots__ = ()
     __match_args__ = ("val",)
 
-    def __init__(self, val: A) -> None:
-        self.val: A = val
+    val: A
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: A) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Third) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"Third({repr(self.val)})"
 
@@ -90,16 +112,23 @@ class Third(Generic[A]):
         return self
 
 
-class Fourth(Generic[A]):
-    __slots__ = ("val",)
+class Fourth(ValBase, Generic[A]):
+    __slots__ = ()
     __match_args__ = ("val",)
 
-    def __init__(self, val: A) -> None:
-        self.val: A = val
+    val: A
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: A) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Fourth) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"Fourth({repr(self.val)})"
 
@@ -119,16 +148,23 @@ class Fourth(Generic[A]):
         return self
 
 
-class Fifth(Generic[A]):
-    __slots__ = ("val",)
+class Fifth(ValBase, Generic[A]):
+    __slots__ = ()
     __match_args__ = ("val",)
 
-    def __init__(self, val: A) -> None:
-        self.val: A = val
+    val: A
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: A) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Fifth) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"Fifth({repr(self.val)})"
 
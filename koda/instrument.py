@@ -0,0 +1,172 @@
+"""
+Opt-in instrumentation for functions returning `Result`s. Once `enable`d, calls of
+`instrumented` functions and of `safe_try` are counted by name, along with how many
+returned `Ok`s and `Err`s (or raised), the types of the errors and how long the calls
+took.
+`snapshot` exports everything recorded so far.
+
+While disabled (the default), the only cost is a check of a flag on each call.
+"""
+import threading
+from collections import Counter, deque
+from functools import wraps
+from math import ceil
+from time import perf_counter
+from typing import Any, Callable, Deque, Dict, List, Optional, TypeVar, cast
+
+from koda.result import Err, Ok, Result
+
+FnT = TypeVar("FnT", bound=Callable[..., Result[Any, Any]])
+
+# how many of the most recent latencies are kept for each name
+LATENCY_SAMPLES: int = 1024
+
+
+class _State:
+    __slots__ = ("enabled",)
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+
+
+_state = _State()
+
+
+class _Stats:
+    __slots__ = ("lock", "oks", "errs", "exceptions", "err_types", "latencies")
+
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.oks: int = 0
+        self.errs: int = 0
+        self.exceptions: int = 0
+        self.err_types: "Counter[str]" = Counter()
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, result: Result[Any, Any], seconds: float) -> None:
+        with self.lock:
+            if type(result) is Ok:
+                self.oks += 1
+            else:
+                self.errs += 1
+                self.err_types[_name_of(type(result.val))] += 1
+            self.latencies.append(seconds)
+
+    def record_exception(self, seconds: float) -> None:
+        with self.lock:
+            self.exceptions += 1
+            self.latencies.append(seconds)
+
+
+_registry: Dict[str, _Stats] = {}
+_registry_lock = threading.Lock()
+
+
+def _stats_for(name: str) -> _Stats:
+    stats = _registry.get(name)
+    if stats is None:
+        with _registry_lock:
+            stats = _registry.setdefault(name, _Stats())
+    return stats
+
+
+def _name_of(fn: Callable[..., Any]) -> str:
+    return f"{getattr(fn, '__module__', None)}.{getattr(fn, '__qualname__', fn)}"
+
+
+def enable() -> None:
+    _state.enabled = True
+
+
+def disable() -> None:
+    _state.enabled = False
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def reset() -> None:
+    """
+    Drop everything recorded so far.
+    """
+    with _registry_lock:
+        _registry.clear()
+
+
+def instrumented(name: Optional[str] = None) -> Callable[[FnT], FnT]:
+    """
+    Record calls of the decorated function under `name`, which defaults to its
+    module and qualified name. Calls which raise are counted as `exceptions`, and the
+    exception is re-raised.
+    """
+
+    def decorator(fn: FnT) -> FnT:
+        stats_name = _name_of(fn) if name is None else name
+
+        @wraps(fn)
+        def inner(*args: Any, **kwargs: Any) -> Result[Any, Any]:
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+            start = perf_counter()
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException:
+                _stats_for(stats_name).record_exception(perf_counter() - start)
+                raise
+            _stats_for(stats_name).record(result, perf_counter() - start)
+            return result
+
+        return cast(FnT, inner)
+
+    return decorator
+
+
+def _record_safe_try(fn: Callable[..., Any], *args: Any) -> Result[Any, Exception]:
+    """
+    `safe_try`, once instrumentation is enabled.
+    """
+    start = perf_counter()
+    result: Result[Any, Exception]
+    try:
+        result = Ok(fn(*args))
+    except Exception as e:
+        result = Err(e)
+    _stats_for(f"safe_try:{_name_of(fn)}").record(result, perf_counter() - start)
+    return result
+
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    # nearest-rank
+    return ordered[max(ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    What has been recorded, by name. Latencies are in seconds, over the most recent
+    `LATENCY_SAMPLES` calls.
+    """
+    with _registry_lock:
+        items = list(_registry.items())
+
+    snap: Dict[str, Dict[str, Any]] = {}
+    # every entry has at least one call, since it's only created to record one
+    for name, stats in items:
+        with stats.lock:
+            calls = stats.oks + stats.errs + stats.exceptions
+            latencies = sorted(stats.latencies)
+            snap[name] = {
+                "calls": calls,
+                "oks": stats.oks,
+                "errs": stats.errs,
+                "exceptions": stats.exceptions,
+                "ok_ratio": stats.oks / calls,
+                "err_types": dict(stats.err_types),
+                "latency": {
+                    "p50": _percentile(latencies, 50),
+                    "p90": _percentile(latencies, 90),
+                    "p99": _percentile(latencies, 99),
+                    "max": latencies[-1],
+                },
+            }
+    return snap
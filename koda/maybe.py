@@ -10,13 +10,19 @@ from typing import (
     Union,
 )
 
+from koda._base import ValBase
 from koda._generics import A, B, FailT
 
 if TYPE_CHECKING:  # pragma: no cover
     from koda.result import Result
 
 
+_NOTHING_HASH: Final[int] = hash("koda.maybe.Nothing")
+
+
 class Nothing:
+    __slots__ = ()
+
     # singleton
     _instance: ClassVar[Optional["Nothing"]] = None
 
@@ -33,6 +39,14 @@ class Nothing:
     def __eq__(self, other: Any) -> bool:
         return other is self._instance
 
+    def __hash__(self) -> int:
+        return _NOTHING_HASH
+
+    def __reduce__(self) -> str:
+        # pickled by reference to `nothing`, which keeps it a singleton with every
+        # protocol
+        return "nothing"
+
     def __repr__(self) -> str:
         return "Nothing()"
 
@@ -56,8 +70,6 @@ class Nothing:
         return None
 
     def to_result(self, fail_obj: FailT) -> "Result[Any, FailT]":
-        from koda.result import Err
-
         return Err(fail_obj)
 
 
@@ -65,18 +77,25 @@ class Nothing:
 nothing: Final[Nothing] = Nothing()
 
 
-class Just(Generic[A]):
+class Just(ValBase, Generic[A]):
     __match_args__ = ("val",)
-    __slots__ = ("val",)
+    __slots__ = ()
 
     is_just: ClassVar[Literal[True]] = True
 
-    def __init__(self, val: A) -> None:
-        self.val: A = val
+    val: A
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: A) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Just) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"Just({repr(self.val)})"
 
@@ -100,9 +119,11 @@ class Just(Generic[A]):
         return self.val
 
     def to_result(self, fail_obj: FailT) -> "Result[A, FailT]":
-        from koda.result import Ok
-
         return Ok(self.val)
 
 
 Maybe = Union[Just[A], Nothing]
+
+# at the bottom, since koda.result imports this module too; by the time
+# it does, everything it uses from here is defined
+from koda.result import Err, Ok  # noqa: E402
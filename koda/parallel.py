@@ -0,0 +1,87 @@
+from collections import deque
+from concurrent.futures import Executor, Future
+from functools import partial
+from itertools import islice
+from typing import Callable, Deque, Generator, Iterable, Iterator, List, Optional
+
+from koda._generics import A, B
+from koda.result import Err, Ok, Result
+
+
+def _run_chunk(fn: Callable[[A], B], chunk: List[A]) -> List[Result[B, Exception]]:
+    """
+    Runs inside the worker, so exceptions come back as `Err`s rather than failing
+    the whole chunk.
+    """
+    results: List[Result[B, Exception]] = []
+    append = results.append
+    for item in chunk:
+        try:
+            append(Ok(fn(item)))
+        except Exception as e:
+            append(Err(e))
+    return results
+
+
+def _chunks(items: Iterable[A], chunksize: int) -> Iterator[List[A]]:
+    if chunksize < 1:
+        raise ValueError("chunksize must be at least 1")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_results(
+    fn: Callable[[A], B],
+    items: Iterable[A],
+    *,
+    executor: Executor,
+    chunksize: int = 1,
+) -> List[Result[B, Exception]]:
+    """
+    Call `fn` on each of `items` in `executor`, capturing exceptions as `Err`s in the
+    worker, and return the `Result`s in input order.
+
+    `items` are sent to the workers in lists of `chunksize`, which cuts down on
+    inter-process communication for a `ProcessPoolExecutor`. `fn` needs to be
+    picklable in that case.
+    """
+    results: List[Result[B, Exception]] = []
+    for chunk_results in executor.map(
+        partial(_run_chunk, fn), _chunks(items, chunksize)
+    ):
+        results.extend(chunk_results)
+    return results
+
+
+def imap_results(
+    fn: Callable[[A], B],
+    items: Iterable[A],
+    *,
+    executor: Executor,
+    chunksize: int = 1,
+    max_pending: Optional[int] = 16,
+) -> Generator[Result[B, Exception], None, None]:
+    """
+    Streaming version of `map_results`: yields the `Result`s in input order as they
+    become available. At most `max_pending` chunks are submitted ahead of what has
+    been consumed, so `items` can be an unbounded iterator (`None` means no limit).
+    Chunks still pending when the generator is closed are cancelled.
+    """
+    if max_pending is not None and max_pending < 1:
+        raise ValueError("max_pending must be at least 1")
+
+    pending: Deque["Future[List[Result[B, Exception]]]"] = deque()
+    try:
+        for chunk in _chunks(items, chunksize):
+            pending.append(executor.submit(_run_chunk, fn, chunk))
+            if max_pending is not None and len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,87 @@
+from typing import Any, Callable, Final, Generic, List, Optional, Tuple, cast
+
+from koda._generics import A, B, C, FailT
+from koda.result import Err, Ok, Result
+
+_MAP: Final[int] = 0
+_FLAT_MAP: Final[int] = 1
+_MAP_ERR: Final[int] = 2
+
+_Stage = Tuple[int, Callable[[Any], Any]]
+
+
+def _apply_all(fns: Tuple[Callable[[Any], Any], ...], val: Any) -> Any:
+    for fn in fns:
+        val = fn(val)
+    return val
+
+
+class ResultPipeline(Generic[A, B, FailT]):
+    """
+    Collects `map`, `flat_map` and `map_err` stages, so they can be compiled once
+    into a single function that behaves like the equivalent method chain on a
+    `Result`, without allocating an intermediate `Ok` or `Err` at each stage.
+
+    `ResultPipeline().map(f).flat_map(g).compile()(result)` gives the same value as
+    `result.map(f).flat_map(g)`.
+    """
+
+    __slots__ = ("_stages",)
+
+    def __init__(self, stages: Tuple[_Stage, ...] = ()) -> None:
+        self._stages: Tuple[_Stage, ...] = stages
+
+    def map(self, fn: Callable[[B], C]) -> "ResultPipeline[A, C, FailT]":
+        return ResultPipeline(self._stages + ((_MAP, fn),))
+
+    def flat_map(
+        self, fn: Callable[[B], Result[C, FailT]]
+    ) -> "ResultPipeline[A, C, FailT]":
+        return ResultPipeline(self._stages + ((_FLAT_MAP, fn),))
+
+    def map_err(self, fn: Callable[[FailT], C]) -> "ResultPipeline[A, B, C]":
+        return ResultPipeline(self._stages + ((_MAP_ERR, fn),))
+
+    def compile(self) -> Callable[[Result[A, Any]], Result[B, FailT]]:
+        # Each `Ok`-path step carries the `map_err` functions that come after it
+        # (or None for a plain `map`), so an `Err` can skip straight to them.
+        ok_steps: List[Tuple[Callable[[Any], Any], Optional[Tuple[Any, ...]]]] = []
+        err_fns: Tuple[Callable[[Any], Any], ...] = ()
+        for kind, fn in reversed(self._stages):
+            if kind == _MAP_ERR:
+                err_fns = (fn,) + err_fns
+            elif kind == _FLAT_MAP:
+                ok_steps.append((fn, err_fns))
+            else:
+                ok_steps.append((fn, None))
+        ok_steps.reverse()
+
+        steps = tuple(ok_steps)
+        input_err_fns = err_fns
+        rewrap = len(steps) > 0 and steps[-1][1] is None
+
+        def inner(result: Result[A, Any]) -> Result[B, FailT]:
+            if type(result) is Ok:
+                val: Any = result.val
+                last: Any = result
+                for fn, after_err_fns in steps:
+                    if after_err_fns is None:
+                        val = fn(val)
+                    else:
+                        last = fn(val)
+                        if type(last) is Ok:
+                            val = last.val
+                        elif after_err_fns:
+                            return Err(_apply_all(after_err_fns, last.val))
+                        else:
+                            return cast("Result[B, FailT]", last)
+                if rewrap:
+                    return Ok(val)
+                else:
+                    return cast("Result[B, FailT]", last)
+            elif input_err_fns:
+                return Err(_apply_all(input_err_fns, result.val))
+            else:
+                return cast("Result[B, FailT]", result)
+
+        return inner
@@ -3,33 +3,71 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Dict,
+    Final,
     Generic,
+    List,
     Literal,
     Optional,
+    Set,
+    Tuple,
+    Type,
     Union,
 )
 
+from koda._base import ValBase
 from koda._generics import A, B, FailT
 
 if TYPE_CHECKING:  # pragma: no cover
     from koda.maybe import Maybe
 
 
-class Ok(Generic[A]):
+class Ok(ValBase, Generic[A]):
     __match_args__ = ("val",)
-    __slots__ = ("val",)
+    __slots__ = ()
 
     is_ok: ClassVar[Literal[True]] = True
 
-    def __init__(self, val: A) -> None:
-        self.val: A = val
+    val: A
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: A) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Ok) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"Ok({repr(self.val)})"
 
+    @staticmethod
+    def of(val: A) -> "Ok[A]":
+        """
+        Same as `Ok(val)`, but returns a shared instance for `None`, bools and small
+        ints, instead of allocating a new one.
+        """
+        val_type = type(val)
+        if val_type is int:
+            if -5 <= val <= 256:  # type: ignore[operator]
+                if _counting_interns:
+                    _intern_counts["ok_hits"] += 1
+                return _ok_small_ints[val + 5]  # type: ignore[operator]
+        elif val_type is bool:
+            if _counting_interns:
+                _intern_counts["ok_hits"] += 1
+            return _ok_true if val else _ok_false
+        elif val is None:
+            if _counting_interns:
+                _intern_counts["ok_hits"] += 1
+            return _ok_none
+        if _counting_interns:
+            _intern_counts["ok_misses"] += 1
+        return Ok(val)
+
     def apply(self, container: "Result[Callable[[A], B], FailT]") -> "Result[B, FailT]":
         if isinstance(container, Ok):
             return Ok(container.val(self.val))
@@ -63,26 +101,64 @@ class Ok(Generic[A]):
 
     @property
     def to_maybe(self) -> "Maybe[A]":
-        from koda.maybe import Just
-
         return Just(self.val)
 
 
-class Err(Generic[FailT]):
+class Err(ValBase, Generic[FailT]):
     __match_args__ = ("val",)
-    __slots__ = ("val",)
+    __slots__ = ()
 
     is_ok: ClassVar[Literal[False]] = False
 
-    def __init__(self, val: FailT) -> None:
-        self.val: FailT = val
+    val: FailT
+
+    if TYPE_CHECKING:  # pragma: no cover
+        # construction is handled by `ValBase`
+
+        def __init__(self, val: FailT) -> None:
+            ...
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Err) and other.val == self.val
 
+    __hash__ = ValBase.__hash__
+
     def __repr__(self) -> str:
         return f"Err({repr(self.val)})"
 
+    @staticmethod
+    def of(val: FailT) -> "Err[FailT]":
+        """
+        Same as `Err(val)`, but returns a shared instance for `None`, bools, small
+        ints and anything registered with `intern_err`.
+        """
+        val_type = type(val)
+        if val_type is int and -5 <= val <= 256:  # type: ignore[operator]
+            if _counting_interns:
+                _intern_counts["err_hits"] += 1
+            return _err_small_ints[val + 5]  # type: ignore[operator]
+        elif val_type is bool:
+            if _counting_interns:
+                _intern_counts["err_hits"] += 1
+            return _err_true if val else _err_false
+        elif val is None:
+            if _counting_interns:
+                _intern_counts["err_hits"] += 1
+            return _err_none
+        elif val_type in _err_sentinel_types:
+            try:
+                sentinel = _err_sentinels.get((val_type, val))
+            except TypeError:
+                # unhashable, so it can't have been registered
+                sentinel = None
+            if sentinel is not None:
+                if _counting_interns:
+                    _intern_counts["err_hits"] += 1
+                return sentinel
+        if _counting_interns:
+            _intern_counts["err_misses"] += 1
+        return Err(val)
+
     def apply(self, _: "Result[Callable[[Any], B], FailT]") -> "Result[B, FailT]":
         return self
 
@@ -110,9 +186,71 @@ class Err(Generic[FailT]):
 
     @property
     def to_maybe(self) -> "Maybe[Any]":
-        from koda.maybe import nothing
-
         return nothing
 
 
 Result = Union[Ok[A], Err[FailT]]
+
+
+# shared instances returned by `Ok.of` and `Err.of`
+_ok_small_ints: Final[List[Ok[Any]]] = [Ok(i) for i in range(-5, 257)]
+_ok_true: Final[Ok[Any]] = Ok(True)
+_ok_false: Final[Ok[Any]] = Ok(False)
+_ok_none: Final[Ok[Any]] = Ok(None)
+_err_small_ints: Final[List[Err[Any]]] = [Err(i) for i in range(-5, 257)]
+_err_true: Final[Err[Any]] = Err(True)
+_err_false: Final[Err[Any]] = Err(False)
+_err_none: Final[Err[Any]] = Err(None)
+_err_sentinels: Final[Dict[Tuple[Type[Any], Any], Err[Any]]] = {}
+_err_sentinel_types: Final[Set[Type[Any]]] = set()
+
+# only counted between `enable_intern_stats` and `disable_intern_stats`, so that
+# `Ok.of` and `Err.of` stay cheaper than allocating
+_counting_interns: bool = False
+_intern_counts: Final[Dict[str, int]] = {
+    "ok_hits": 0,
+    "ok_misses": 0,
+    "err_hits": 0,
+    "err_misses": 0,
+}
+
+
+def intern_err(val: FailT) -> Err[FailT]:
+    """
+    Register a (hashable) error value, so `Err.of` returns the same instance for it
+    every time. Returns that instance.
+    """
+    val_type = type(val)
+    key = (val_type, val)
+    if key not in _err_sentinels:
+        _err_sentinels[key] = Err(val)
+        _err_sentinel_types.add(val_type)
+    return _err_sentinels[key]
+
+
+def enable_intern_stats() -> None:
+    global _counting_interns
+    _counting_interns = True
+
+
+def disable_intern_stats() -> None:
+    global _counting_interns
+    _counting_interns = False
+
+
+def intern_stats() -> Dict[str, int]:
+    """
+    How often `Ok.of` and `Err.of` returned a shared instance (hits) or had to
+    allocate a new one (misses), while `enable_intern_stats` was in effect.
+    """
+    return dict(_intern_counts)
+
+
+def reset_intern_stats() -> None:
+    for key in _intern_counts:
+        _intern_counts[key] = 0
+
+
+# at the bottom, since koda.maybe imports this module too; by the time
+# it does, everything it uses from here is defined
+from koda.maybe import Just, nothing  # noqa: E402
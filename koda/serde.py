@@ -0,0 +1,223 @@
+"""
+Compact encodings for sequences of containers, for sending them between processes
+or spilling them to disk.
+
+`encode` splits containers into one tag byte each plus a list of their values, so
+pickling a million `Ok`s writes a million payloads rather than a million objects:
+
+    tags, vals = encode([Ok(1), Err("bad"), Just(2), nothing])
+    assert decode(tags, vals) == [Ok(1), Err("bad"), Just(2), nothing]
+
+`to_tagged` and `from_tagged` convert single containers to and from one-key dicts,
+such as `{"ok": 1}`, which msgpack or JSON can represent directly. Values are not
+converted recursively.
+
+`JsonFormat` tags containers for the `json` module, nested containers included, and
+streams containers as newline-delimited JSON. `json_default` and `json_object_hook`
+use its default tagging, `{"__koda__": "ok", "val": 1}`:
+
+    dumped = json.dumps({"user": Ok(Just(1))}, default=json_default)
+    assert json.loads(dumped, object_hook=json_object_hook) == {"user": Ok(Just(1))}
+"""
+from json import JSONDecoder, JSONEncoder
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from koda.either import Either5, Fifth, First, Fourth, Second, Third
+from koda.maybe import Just, Maybe, Nothing, nothing
+from koda.result import Err, Ok, Result
+
+Container = Union[Result[Any, Any], Maybe[Any], Either5[Any, Any, Any, Any, Any]]
+
+# the position of each type is its tag, so never reorder these
+_TYPES: Tuple[type, ...] = (
+    Ok,
+    Err,
+    Just,
+    Nothing,
+    First,
+    Second,
+    Third,
+    Fourth,
+    Fifth,
+)
+_TAGS: Dict[type, int] = {typ: tag for tag, typ in enumerate(_TYPES)}
+_NOTHING_TAG: int = _TAGS[Nothing]
+
+_NAMES: Dict[type, str] = {typ: typ.__name__.lower() for typ in _TYPES}
+_TYPES_BY_NAME: Dict[str, type] = {name: typ for typ, name in _NAMES.items()}
+
+
+def encode(containers: Iterable[Container]) -> Tuple[bytes, List[Any]]:
+    """
+    The tag of each container, and the values of all but the `Nothing`s, in order.
+    """
+    tags = bytearray()
+    append_tag = tags.append
+    vals: List[Any] = []
+    append_val = vals.append
+    for container in containers:
+        typ = type(container)
+        try:
+            append_tag(_TAGS[typ])
+        except KeyError:
+            raise TypeError(f"cannot encode {container!r}") from None
+        if typ is not Nothing:
+            append_val(container.val)  # type: ignore[union-attr]
+    return bytes(tags), vals
+
+
+def decode(tags: bytes, vals: Sequence[Any]) -> List[Container]:
+    """
+    The containers that `encode` produced `tags` and `vals` from.
+    """
+    containers: List[Container] = []
+    append = containers.append
+    next_val = iter(vals).__next__
+    try:
+        for tag in tags:
+            if tag == _NOTHING_TAG:
+                append(nothing)
+            else:
+                append(_TYPES[tag](next_val()))
+    except IndexError:
+        raise ValueError(f"unknown tag {tag}") from None
+    except StopIteration:
+        raise ValueError("more tags than values") from None
+
+    if len(containers) - tags.count(_NOTHING_TAG) != len(vals):
+        raise ValueError("more values than tags")
+    return containers
+
+
+def to_tagged(container: Container) -> Dict[str, Any]:
+    """
+    A one-key dict of the container's lowercased type name and its value, e.g.
+    `{"ok": 1}`. `Nothing` becomes `{"nothing": None}`.
+    """
+    try:
+        name = _NAMES[type(container)]
+    except KeyError:
+        raise TypeError(f"cannot encode {container!r}") from None
+    if name == "nothing":
+        return {name: None}
+    return {name: container.val}  # type: ignore[union-attr]
+
+
+def from_tagged(data: Mapping[str, Any]) -> Container:
+    """
+    The container that `to_tagged` produced `data` from.
+    """
+    if len(data) != 1:
+        raise ValueError(f"expected a single tag, got {data!r}")
+    ((name, val),) = data.items()
+    try:
+        typ = _TYPES_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"unknown tag {name!r}") from None
+    if typ is Nothing:
+        return nothing
+    return typ(val)  # type: ignore[no-any-return]
+
+
+class JsonFormat:
+    """
+    How containers are tagged in JSON. By default each container is an object like
+    `{"__koda__": "ok", "val": 1}` (`val_key` is left out for `Nothing`). With
+    `tag_key=None` it's a one-key object, `{"ok": 1}`, as with `to_tagged`, which is
+    more compact but turns any other one-key object named after a container type into
+    that container when decoding.
+
+    `names` overrides the tags of some or all container types.
+    """
+
+    __slots__ = ("tag_key", "val_key", "_names", "_types", "_encode", "_decode")
+
+    def __init__(
+        self,
+        tag_key: Optional[str] = "__koda__",
+        val_key: str = "val",
+        names: Optional[Mapping[type, str]] = None,
+    ) -> None:
+        self.tag_key: Optional[str] = tag_key
+        self.val_key: str = val_key
+        self._names: Dict[type, str] = {**_NAMES, **(names or {})}
+        self._types: Dict[str, type] = {name: typ for typ, name in self._names.items()}
+        if len(self._types) != len(self._names):
+            raise ValueError("container types need distinct names")
+        self._encode = JSONEncoder(default=self.default).encode
+        self._decode = JSONDecoder(object_hook=self.object_hook).decode
+
+    def default(self, obj: Any) -> Dict[str, Any]:
+        """
+        For `json.dump(s)`'s `default`. The values of containers are not copied.
+        """
+        try:
+            name = self._names[type(obj)]
+        except KeyError:
+            raise TypeError(
+                f"Object of type {type(obj).__name__} is not JSON serializable"
+            ) from None
+        if self.tag_key is None:
+            return {name: None if type(obj) is Nothing else obj.val}
+        if type(obj) is Nothing:
+            return {self.tag_key: name}
+        return {self.tag_key: name, self.val_key: obj.val}
+
+    def object_hook(self, data: Dict[str, Any]) -> Any:
+        """
+        For `json.load(s)`'s `object_hook`. Objects which aren't tagged containers are
+        returned as they are.
+        """
+        if self.tag_key is None:
+            if len(data) != 1:
+                return data
+            ((name, val),) = data.items()
+            typ = self._types.get(name)
+            if typ is None or (typ is Nothing and val is not None):
+                return data
+        else:
+            tag = data.get(self.tag_key)
+            typ = self._types.get(tag) if type(tag) is str else None
+            # only `Nothing` has no value
+            has_val = self.val_key in data
+            if typ is None or len(data) != 1 + has_val or (typ is Nothing) is has_val:
+                return data
+            val = data.get(self.val_key)
+
+        return nothing if typ is Nothing else typ(val)
+
+    def dump_lines(self, containers: Iterable[Container], fp: TextIO) -> None:
+        """
+        Write each container to `fp` as one line of JSON, as it's consumed from
+        `containers`.
+        """
+        encode = self._encode
+        default = self.default
+        fp.writelines(f"{encode(default(container))}\n" for container in containers)
+
+    def load_lines(self, lines: Iterable[str]) -> Iterator[Any]:
+        """
+        Decode each non-blank line, lazily.
+        """
+        decode = self._decode
+        for line in lines:
+            if line.strip():
+                yield decode(line)
+
+
+_default_format: JsonFormat = JsonFormat()
+
+json_default = _default_format.default
+json_object_hook = _default_format.object_hook
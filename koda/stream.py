@@ -0,0 +1,131 @@
+"""
+Lazy operations over iterators of `Result`s and `Maybe`s. None of these hold on to
+more than the current item (or the current chunk, for `chunked_collect`), so they
+can be used on streams that don't fit in memory.
+"""
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Union,
+    cast,
+    overload,
+)
+
+from koda._generics import A, B, FailT
+from koda.batch import collect_results
+from koda.maybe import Just, Maybe
+from koda.result import Err, Ok, Result
+
+
+def filter_ok(results: Iterable[Result[A, Any]]) -> Iterator[A]:
+    """
+    The values of the `Ok`s, skipping `Err`s.
+    """
+    for result in results:
+        if type(result) is Ok:
+            yield result.val
+
+
+def filter_just(maybes: Iterable[Maybe[A]]) -> Iterator[A]:
+    """
+    The values of the `Just`s, skipping `Nothing`s.
+    """
+    for maybe in maybes:
+        if type(maybe) is Just:
+            yield maybe.val
+
+
+def errors_only(results: Iterable[Result[Any, FailT]]) -> Iterator[FailT]:
+    """
+    The values of the `Err`s, skipping `Ok`s.
+    """
+    for result in results:
+        if type(result) is Err:
+            yield result.val
+
+
+def map_ok(
+    results: Iterable[Result[A, FailT]], fn: Callable[[A], B]
+) -> Iterator[Result[B, FailT]]:
+    """
+    `Result.map` for each item.
+    """
+    for result in results:
+        if type(result) is Ok:
+            yield Ok(fn(result.val))
+        else:
+            yield cast("Err[FailT]", result)
+
+
+def flat_map_ok(
+    results: Iterable[Result[A, FailT]], fn: Callable[[A], Result[B, FailT]]
+) -> Iterator[Result[B, FailT]]:
+    """
+    `Result.flat_map` for each item.
+    """
+    for result in results:
+        if type(result) is Ok:
+            yield fn(result.val)
+        else:
+            yield cast("Err[FailT]", result)
+
+
+def take_until_err(results: Iterable[Result[A, FailT]]) -> Iterator[Result[A, FailT]]:
+    """
+    The `Result`s up to and including the first `Err`. Nothing after that is consumed.
+    """
+    for result in results:
+        yield result
+        if type(result) is not Ok:
+            return
+
+
+@overload
+def chunked_collect(
+    results: Iterable[Result[A, FailT]], size: int
+) -> Iterator[Result[List[A], FailT]]:
+    ...  # pragma: no cover
+
+
+@overload
+def chunked_collect(
+    results: Iterable[Result[A, FailT]], size: int, accumulate: Literal[False]
+) -> Iterator[Result[List[A], FailT]]:
+    ...  # pragma: no cover
+
+
+@overload
+def chunked_collect(
+    results: Iterable[Result[A, FailT]], size: int, accumulate: Literal[True]
+) -> Iterator[Result[List[A], List[FailT]]]:
+    ...  # pragma: no cover
+
+
+def chunked_collect(
+    results: Iterable[Result[A, FailT]], size: int, accumulate: bool = False
+) -> Union[Iterator[Result[List[A], FailT]], Iterator[Result[List[A], List[FailT]]]]:
+    """
+    `koda.batch.collect_results` over consecutive chunks of `size` results. Each chunk
+    is fully consumed, even if it has an `Err`, so chunks stay aligned.
+    """
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    return _chunked_collect(iter(results), size, accumulate)
+
+
+def _chunked_collect(
+    iterator: Iterator[Result[A, FailT]], size: int, accumulate: bool
+) -> Iterator[Any]:
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        if accumulate:
+            yield collect_results(chunk, True)
+        else:
+            yield collect_results(chunk)
@@ -0,0 +1,83 @@
+"""
+Stack-safe chains of `flat_map`s, for recursion too deep for Python's stack.
+
+A step is a `Result` or `Maybe` (finished), a `Bounce` (a step that hasn't been
+computed yet) or a `FlatMap` (a step, and what to do with its value if it's an `Ok`
+or `Just`). Recursive functions return steps instead of calling themselves, and
+`run` evaluates them in a loop, however deep the recursion goes:
+
+    def sum_to(n: int) -> Step[Result[int, str]]:
+        if n < 0:
+            return Err("negative")
+        if n == 0:
+            return Ok(0)
+        return FlatMap(Bounce(lambda: sum_to(n - 1)), lambda total: Ok(total + n))
+
+    assert run(sum_to(100_000)) == Ok(5_000_050_000)
+"""
+from typing import Any, Callable, Generic, List, Union, overload
+
+from koda._generics import A, FailT
+from koda.maybe import Just, Maybe
+from koda.result import Ok, Result
+
+
+class Bounce(Generic[A]):
+    """
+    A step which is computed by calling `thunk` when `run` gets to it.
+    """
+
+    __slots__ = ("thunk",)
+
+    def __init__(self, thunk: Callable[[], "Step[A]"]) -> None:
+        self.thunk: Callable[[], "Step[A]"] = thunk
+
+
+class FlatMap(Generic[A]):
+    """
+    Continue with `fn` called on the value of `step`, if it's an `Ok` or a `Just`.
+    An `Err` or `Nothing` ends the whole computation.
+    """
+
+    __slots__ = ("step", "fn")
+
+    def __init__(self, step: "Step[Any]", fn: Callable[[Any], "Step[A]"]) -> None:
+        self.step: "Step[Any]" = step
+        self.fn: Callable[[Any], "Step[A]"] = fn
+
+
+# `A` is the `Result` or `Maybe` that the computation finishes with
+Step = Union[A, Bounce[A], FlatMap[A]]
+
+
+@overload
+def run(step: "Step[Result[A, FailT]]") -> Result[A, FailT]:
+    ...  # pragma: no cover
+
+
+@overload
+def run(step: "Step[Maybe[A]]") -> Maybe[A]:
+    ...  # pragma: no cover
+
+
+def run(step: Step[Any]) -> Any:
+    """
+    Evaluate `step` iteratively, with the continuations of pending `FlatMap`s kept
+    on a list rather than on the call stack.
+    """
+    continuations: List[Callable[[Any], Any]] = []
+    current: Any = step
+    while True:
+        step_type = type(current)
+        if step_type is FlatMap:
+            continuations.append(current.fn)
+            current = current.step
+        elif step_type is Bounce:
+            current = current.thunk()
+        elif not continuations:
+            return current
+        elif step_type is Ok or step_type is Just:
+            current = continuations.pop()(current.val)
+        else:
+            # an `Err` or `Nothing` skips everything still pending
+            return current
@@ -1,15 +1,28 @@
-from typing import Any, Callable, List, Mapping, Optional, Protocol, TypeVar
-
-from koda._cruft import _compose, _safe_try
-from koda._generics import A, B, FailT
+from functools import lru_cache, wraps
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from koda._cruft import _compose, _identity, _safe_try
+from koda._generics import A, B, ExcT, FailT
 from koda.maybe import Just, Maybe, nothing
 from koda.result import Err, Ok, Result
 
 compose = _compose
-
-
-def identity(x: A) -> A:
-    return x
+identity = _identity
 
 
 def mapping_get(data: Mapping[A, B], key: A) -> Maybe[B]:
@@ -23,6 +36,64 @@ def mapping_get(data: Mapping[A, B], key: A) -> Maybe[B]:
         return nothing
 
 
+def mapping_get_many(data: Mapping[A, B], keys: Iterable[A]) -> Tuple[Maybe[B], ...]:
+    """
+    `mapping_get` for each of `keys`.
+    """
+    return tuple([Just(data[key]) if key in data else nothing for key in keys])
+
+
+def mapping_get_all(data: Mapping[A, B], keys: Iterable[A]) -> Maybe[Tuple[B, ...]]:
+    """
+    `Just` the values for all of `keys`, or `nothing` if any of them is missing.
+    """
+    vals: List[B] = []
+    append = vals.append
+    for key in keys:
+        if key in data:
+            append(data[key])
+        else:
+            return nothing
+    return Just(tuple(vals))
+
+
+# `typed` caches keys that are equal but of different types, like `1`, `True` and
+# `1.0`, separately, since only the `int` can index into a list or tuple
+@lru_cache(maxsize=1024, typed=True)
+def _compile_path(*path: Hashable) -> Callable[[Any], Maybe[Any]]:
+    # whether each key can index into a list or tuple is decided once per path
+    steps: Tuple[Tuple[Any, bool], ...] = tuple(
+        [(key, type(key) is int) for key in path]
+    )
+
+    def get_path(data: Any) -> Maybe[Any]:
+        for key, is_index in steps:
+            data_type = type(data)
+            if is_index and (data_type is list or data_type is tuple):
+                if -len(data) <= key < len(data):
+                    data = data[key]
+                else:
+                    return nothing
+            elif (data_type is dict or isinstance(data, Mapping)) and key in data:
+                data = data[key]
+            else:
+                return nothing
+        return Just(data)
+
+    return get_path
+
+
+def mapping_get_path(data: Any, path: Sequence[Hashable]) -> Maybe[Any]:
+    """
+    Get a value from nested `Mapping`s, returning `nothing` at the first missing key.
+    `int` keys also index into `list`s and `tuple`s, so JSON-like data can be
+    traversed, i.e. `mapping_get_path({"a": [{"b": 1}]}, ("a", 0, "b")) == Just(1)`.
+
+    The path is compiled once and cached, so reusing the same path is cheap.
+    """
+    return _compile_path(*path)(data)
+
+
 def to_maybe(val: Optional[A]) -> Maybe[A]:
     if val is None:
         return nothing
@@ -67,6 +138,46 @@ def load_once(fn: Thunk[A]) -> Thunk[A]:
 safe_try = _safe_try
 
 
+@overload
+def returns_result() -> (
+    Callable[[Callable[..., A]], Callable[..., Result[A, Exception]]]
+):
+    ...  # pragma: no cover
+
+
+@overload
+def returns_result(
+    exceptions: Union[Type[ExcT], Tuple[Type[ExcT], ...]]
+) -> Callable[[Callable[..., A]], Callable[..., Result[A, ExcT]]]:
+    ...  # pragma: no cover
+
+
+def returns_result(
+    exceptions: Union[Type[BaseException], Tuple[Type[BaseException], ...]] = Exception,
+) -> Callable[[Callable[..., A]], Callable[..., Result[A, Any]]]:
+    """
+    Decorator version of `safe_try`: the decorated function returns `Ok` of its
+    value, or `Err` of any of `exceptions` it raises. Other exceptions propagate.
+    It accepts any arguments, and costs less per call than `safe_try`.
+
+    Type checkers only see the return type of the decorated function, not its
+    parameters, since python 3.8 has no `ParamSpec` to carry them over. Arguments
+    aren't checked; use `safe_try` where that matters.
+    """
+
+    def decorator(fn: Callable[..., A]) -> Callable[..., Result[A, Any]]:
+        @wraps(fn)
+        def inner(*args: Any, **kwargs: Any) -> Result[A, Any]:
+            try:
+                return Ok(fn(*args, **kwargs))
+            except exceptions as e:
+                return Err(e)
+
+        return inner
+
+    return decorator
+
+
 A_co = TypeVar("A_co", covariant=True)
 
 
@@ -0,0 +1,177 @@
+import asyncio
+import warnings
+from typing import Any, Awaitable, Coroutine, Dict, List
+
+import pytest
+
+from koda._generics import A
+from koda.aio import (
+    flat_map_async,
+    gather_results,
+    map_async,
+    returns_result_async,
+    safe_try_async,
+)
+from koda.result import Err, Ok, Result
+from tests.utils import assert_same_error_type_with_same_message
+
+
+def _run(awaitable: Awaitable[A]) -> A:
+    async def main() -> A:
+        return await awaitable
+
+    return asyncio.run(main())
+
+
+async def _divide(a: int, b: int) -> float:
+    await asyncio.sleep(0)
+    return a / b
+
+
+async def _async_inc(n: int) -> int:
+    return n + 1
+
+
+async def _async_positive(n: int) -> Result[int, str]:
+    return Ok(n) if n > 0 else Err("not positive")
+
+
+def _delayed(val: Result[int, str], delay: float, log: List[str]) -> Any:
+    async def inner() -> Result[int, str]:
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            log.append(f"cancelled {val}")
+            raise
+        log.append(f"finished {val}")
+        return val
+
+    return inner()
+
+
+def test_safe_try_async() -> None:
+    assert _run(safe_try_async(_divide, 4, 2)) == Ok(2.0)
+    assert _run(safe_try_async(_divide, a=4, b=2)) == Ok(2.0)
+    assert_same_error_type_with_same_message(
+        _run(safe_try_async(_divide, 4, 0)), Err(ZeroDivisionError("division by zero"))
+    )
+
+
+def test_returns_result_async() -> None:
+    divide = returns_result_async()(_divide)
+    assert _run(divide(4, 2)) == Ok(2.0)
+    assert _run(divide(a=4, b=2)) == Ok(2.0)
+    assert_same_error_type_with_same_message(
+        _run(divide(4, 0)), Err(ZeroDivisionError("division by zero"))
+    )
+    assert divide.__name__ == "_divide"
+
+    @returns_result_async((KeyError, ValueError))
+    async def parse(data: Dict[str, str], key: str) -> int:
+        return int(data[key])
+
+    assert _run(parse({"a": "1"}, "a")) == Ok(1)
+    assert type(_run(parse({}, "a")).val) is KeyError
+    with pytest.raises(TypeError):
+        _run(parse(None, "a"))
+
+
+def test_map_async() -> None:
+    assert _run(map_async(Ok(1), _async_inc)) == Ok(2)
+    err: Result[int, str] = Err("x")
+    assert _run(map_async(err, _async_inc)) is err
+
+
+def test_flat_map_async() -> None:
+    assert _run(flat_map_async(Ok(1), _async_positive)) == Ok(1)
+    assert _run(flat_map_async(Ok(0), _async_positive)) == Err("not positive")
+    err: Result[int, str] = Err("x")
+    assert _run(flat_map_async(err, _async_positive)) is err
+
+
+def test_gather_results_keeps_input_order() -> None:
+    log: List[str] = []
+    awaitables = [
+        _delayed(Ok(1), 0.03, log),
+        _delayed(Ok(2), 0.01, log),
+        _delayed(Ok(3), 0.02, log),
+    ]
+    assert _run(gather_results(awaitables)) == Ok([1, 2, 3])
+    assert log == ["finished Ok(2)", "finished Ok(3)", "finished Ok(1)"]
+    assert _run(gather_results([])) == Ok([])
+
+
+def test_gather_results_fail_fast_cancels_pending() -> None:
+    log: List[str] = []
+    awaitables = [
+        _delayed(Ok(1), 1, log),
+        _delayed(Err("first"), 0.01, log),
+        _delayed(Err("second"), 1, log),
+    ]
+    assert _run(gather_results(awaitables)) == Err("first")
+    assert sorted(log) == [
+        "cancelled Err('second')",
+        "cancelled Ok(1)",
+        "finished Err('first')",
+    ]
+
+
+def test_gather_results_accumulate() -> None:
+    log: List[str] = []
+    awaitables = [
+        _delayed(Err("a"), 0.02, log),
+        _delayed(Ok(1), 0, log),
+        _delayed(Err("b"), 0.01, log),
+    ]
+    assert _run(gather_results(awaitables, accumulate=True)) == Err(["a", "b"])
+    assert len(log) == 3
+
+    oks = [_delayed(Ok(i), 0, log) for i in range(3)]
+    assert _run(gather_results(oks, accumulate=True)) == Ok([0, 1, 2])
+
+
+def test_gather_results_limit() -> None:
+    running: List[int] = []
+    max_running: List[int] = [0]
+
+    def tracked(i: int) -> Coroutine[Any, Any, Result[int, str]]:
+        async def inner() -> Result[int, str]:
+            running.append(i)
+            max_running[0] = max(max_running[0], len(running))
+            await asyncio.sleep(0.001)
+            running.remove(i)
+            return Ok(i)
+
+        return inner()
+
+    result: Result[List[int], str] = _run(
+        gather_results([tracked(i) for i in range(10)], limit=3)
+    )
+    assert result == Ok(list(range(10)))
+    assert max_running[0] == 3
+
+    with pytest.raises(ValueError):
+        _run(gather_results([], limit=0))
+
+
+def test_gather_results_limit_fail_fast_closes_unstarted() -> None:
+    log: List[str] = []
+    awaitables = [_delayed(Err("a"), 0, log)] + [
+        _delayed(Ok(i), 1, log) for i in range(5)
+    ]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert _run(gather_results(awaitables, limit=1)) == Err("a")
+    # only the next one in line got started
+    assert log == ["finished Err('a')", "cancelled Ok(0)"]
+
+
+def test_gather_results_exception_cancels_pending() -> None:
+    log: List[str] = []
+
+    async def fail() -> Result[int, str]:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        _run(gather_results([_delayed(Ok(1), 1, log), fail()], accumulate=True))
+    assert log == ["cancelled Ok(1)"]
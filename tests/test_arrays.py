@@ -0,0 +1,169 @@
+from array import array
+from typing import List, Optional
+
+import pytest
+
+from koda.arrays import MaybeArray, ResultArray
+from koda.maybe import Just, Maybe, nothing
+from koda.result import Err, Ok, Result
+
+_RESULTS: List[Result[float, str]] = [Ok(1.5), Err("a"), Ok(2.0), Err("b"), Ok(-3.0)]
+
+
+def test_result_array_round_trip() -> None:
+    results = ResultArray.from_results(_RESULTS)
+    assert len(results) == 5
+    assert results.to_results() == _RESULTS
+    assert list(results) == _RESULTS
+    assert results.values == array("d", [1.5, 0, 2.0, 0, -3.0])
+    assert results.ok_mask == b"\x01\x00\x01\x00\x01"
+    assert dict(results.errs) == {1: "a", 3: "b"}
+    assert repr(results) == f"ResultArray({_RESULTS!r})"
+
+    assert ResultArray.from_results([]).to_results() == []
+    int_results: List[Result[float, str]] = [Ok(1), Err("x")]
+    ints = ResultArray.from_results(int_results, "q")
+    assert ints.values == array("q", [1, 0])
+
+
+def test_result_array_getitem() -> None:
+    results = ResultArray.from_results(_RESULTS)
+    assert results[0] == Ok(1.5)
+    assert results[1] == Err("a")
+    assert results[-1] == Ok(-3.0)
+    assert results[-2] == Err("b")
+    with pytest.raises(IndexError):
+        results[5]
+
+
+def test_result_array_slice() -> None:
+    results = ResultArray.from_results(_RESULTS)
+    for index in [slice(0, 2), slice(1, None), slice(None, None, -2), slice(3, 1)]:
+        sliced = results[index]
+        assert isinstance(sliced, ResultArray)
+        assert sliced.to_results() == _RESULTS[index]
+    assert results[1:4].errs == {0: "a", 2: "b"}
+    with pytest.raises(TypeError):
+        results["a"]  # type: ignore[call-overload]
+
+
+def test_result_array_from_values() -> None:
+    results: ResultArray[str] = ResultArray.from_values(range(3), "b")
+    assert results.to_results() == [Ok(0), Ok(1), Ok(2)]
+    assert results.values.typecode == "b"
+
+
+def test_result_array_init_checks_lengths() -> None:
+    with pytest.raises(ValueError):
+        ResultArray(array("d", [1.0]), b"", {})
+
+
+def test_result_array_map() -> None:
+    results = ResultArray.from_results(_RESULTS)
+    # errors must not be passed to `fn`
+    assert results.map(lambda x: 1 / x).to_results() == [
+        Ok(1 / 1.5),
+        Err("a"),
+        Ok(0.5),
+        Err("b"),
+        Ok(1 / -3.0),
+    ]
+    all_ok: ResultArray[str] = ResultArray.from_values([1.5, 2.5])
+    assert all_ok.map(lambda x: x * 2).to_results() == [Ok(3.0), Ok(5.0)]
+
+    rounded = results.map(round, "q")
+    assert rounded.values.typecode == "q"
+    assert rounded.to_results() == [Ok(2), Err("a"), Ok(2), Err("b"), Ok(-3)]
+    # the original is unchanged
+    assert results.to_results() == _RESULTS
+
+
+def test_result_array_filter_ok() -> None:
+    assert ResultArray.from_results(_RESULTS).filter_ok() == array(
+        "d", [1.5, 2.0, -3.0]
+    )
+    all_ok: ResultArray[str] = ResultArray.from_values([1, 2], "q")
+    assert all_ok.filter_ok() == array("q", [1, 2])
+    assert all_ok.filter_ok() is not all_ok.values
+
+
+def test_result_array_get_or_else() -> None:
+    results = ResultArray.from_results(_RESULTS)
+    assert results.get_or_else(9) == array("d", [1.5, 9, 2.0, 9, -3.0])
+    assert results.values == array("d", [1.5, 0, 2.0, 0, -3.0])
+
+
+# more than 8, so the bitmap spans several bytes
+_OPTIONALS: List[Optional[float]] = [1.5, None, 2.0, 3.0, None, None, 4.0, 5.0, 6.0]
+
+
+def test_maybe_array_round_trip() -> None:
+    maybes = MaybeArray.from_optionals(_OPTIONALS)
+    assert len(maybes) == 9
+    assert maybes.count() == 6
+    assert maybes.to_optional() == _OPTIONALS
+    assert maybes.bitmap == bytes([0b11001101, 0b1])
+    assert maybes.values == array("d", [1.5, 0, 2.0, 3.0, 0, 0, 4.0, 5.0, 6.0])
+    assert repr(maybes) == f"MaybeArray({_OPTIONALS!r})"
+
+    as_maybes: List[Maybe[float]] = [
+        Just(1.5),
+        nothing,
+        Just(2.0),
+        Just(3.0),
+        nothing,
+        nothing,
+        Just(4.0),
+        Just(5.0),
+        Just(6.0),
+    ]
+    assert maybes.to_maybes() == as_maybes
+    assert list(maybes) == as_maybes
+    assert MaybeArray.from_maybes(as_maybes).to_optional() == _OPTIONALS
+
+    empty = MaybeArray.from_optionals([])
+    assert (len(empty), empty.count(), empty.bitmap) == (0, 0, b"")
+    ints = MaybeArray.from_maybes([Just(1), nothing], "q")
+    assert ints.values == array("q", [1, 0])
+
+
+def test_maybe_array_getitem() -> None:
+    maybes = MaybeArray.from_optionals(_OPTIONALS)
+    assert maybes[0] == Just(1.5)
+    assert maybes[1] == nothing
+    assert maybes[8] == Just(6.0)
+    assert maybes[-4] == nothing
+    with pytest.raises(IndexError):
+        maybes[9]
+
+
+def test_maybe_array_init_checks_bitmap() -> None:
+    with pytest.raises(ValueError):
+        MaybeArray(array("d", [1.0] * 9), b"\xff")
+    # padding bits aren't counted
+    assert MaybeArray(array("d", [1.0]), b"\xff").count() == 1
+
+
+def test_maybe_array_map() -> None:
+    maybes = MaybeArray.from_optionals(_OPTIONALS)
+    # missing values must not be passed to `fn`
+    assert maybes.map(lambda x: 3 / x).to_optional() == [
+        None if val is None else 3 / val for val in _OPTIONALS
+    ]
+    full = MaybeArray.from_optionals([1.0, 2.0])
+    assert full.map(lambda x: x * 2).to_optional() == [2.0, 4.0]
+
+    rounded = maybes.map(round, "q")
+    assert rounded.values.typecode == "q"
+    assert rounded.to_optional() == [2, None, 2, 3, None, None, 4, 5, 6]
+    assert maybes.to_optional() == _OPTIONALS
+
+
+def test_maybe_array_get_or_else() -> None:
+    maybes = MaybeArray.from_optionals(_OPTIONALS)
+    assert maybes.get_or_else(-1) == array(
+        "d", [-1 if val is None else val for val in _OPTIONALS]
+    )
+    full = MaybeArray.from_optionals([1.0, 2.0])
+    assert full.get_or_else(-1) == array("d", [1.0, 2.0])
+    assert full.get_or_else(-1) is not full.values
@@ -0,0 +1,113 @@
+"""
+`Ok`, `Err`, `Just` and `First`..`Fifth` are built on the compiled
+`koda._speedups.ValBase` when it's available, and `koda._base._PyValBase` otherwise.
+Both need to behave identically.
+"""
+import copy
+import os
+import pickle
+import subprocess
+import sys
+from importlib.util import find_spec
+from typing import Any, List
+
+import pytest
+
+from koda import Err, Fifth, First, Fourth, Just, Ok, Second, Third, nothing
+from koda._base import USING_SPEEDUPS, ValBase, _PyValBase
+
+_CONTAINERS: List[Any] = [Ok, Err, Just, First, Second, Third, Fourth, Fifth]
+
+_PARITY_TEST_MODULES: List[str] = [
+    "tests/test_either.py",
+    "tests/test_maybe.py",
+    "tests/test_result.py",
+    "tests/test_together.py",
+    "tests/test_not_typesafe.py",
+] + (["tests/test_310.py"] if sys.version_info >= (3, 10) else [])
+
+
+def test_backend_selection() -> None:
+    for container in _CONTAINERS:
+        assert issubclass(container, ValBase)
+    assert USING_SPEEDUPS == (ValBase is not _PyValBase)
+
+
+def test_py_val_base() -> None:
+    obj = _PyValBase(5)
+    assert obj.val == 5
+    assert obj.__reduce__() == (_PyValBase, (5,))
+    assert not hasattr(obj, "__dict__")
+    assert hash(obj) == hash(obj) == hash(_PyValBase(5))
+    with pytest.raises(AttributeError):
+        obj.val = 6
+    with pytest.raises(AttributeError):
+        del obj.val
+    # `val` is only set on construction
+    untyped: Any = obj
+    untyped.__init__(6)
+    assert obj.val == 5
+
+
+def test_no_dict_or_weakref() -> None:
+    # these are held in the millions, so keep them to the single `val` slot
+    for obj in [container(5) for container in _CONTAINERS] + [nothing]:
+        assert not hasattr(obj, "__dict__")
+        assert not hasattr(obj, "__weakref__")
+        assert type(obj).__dictoffset__ == 0
+        assert type(obj).__weakrefoffset__ == 0
+        with pytest.raises(AttributeError):
+            obj.other = 1
+
+
+def test_construction() -> None:
+    for container in _CONTAINERS:
+        assert container(5).val == 5
+        assert container(val=5).val == 5
+        with pytest.raises(TypeError):
+            container()
+        with pytest.raises(TypeError):
+            container(1, 2)
+        with pytest.raises(TypeError):
+            container(other=1)
+
+
+def test_pickle_and_copy() -> None:
+    for container in _CONTAINERS:
+        obj = container([1, {"a": container(2)}])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(obj, protocol)) == obj
+        assert copy.copy(obj) == obj
+        assert copy.copy(obj).val is obj.val
+        assert copy.deepcopy(obj) == obj
+        assert copy.deepcopy(obj).val is not obj.val
+
+
+@pytest.mark.parametrize("pure_python", [False, True])
+def test_suite_passes_on_each_backend(pure_python: bool) -> None:
+    env = dict(os.environ)
+    env.pop("KODA_PURE_PYTHON", None)
+    if pure_python:
+        env["KODA_PURE_PYTHON"] = "1"
+    elif find_spec("koda._speedups") is None:
+        pytest.skip("koda._speedups isn't built, so only pure python was tested")
+
+    backend = subprocess.run(
+        [sys.executable, "-c", "import koda._base; print(koda._base.USING_SPEEDUPS)"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert backend.stdout.strip() == str(not pure_python)
+
+    args = [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider"]
+    args.extend(["-o", "addopts="])
+    args.extend(_PARITY_TEST_MODULES)
+    completed = subprocess.run(
+        args,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert completed.returncode == 0, completed.stdout + completed.stderr
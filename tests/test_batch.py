@@ -0,0 +1,125 @@
+from typing import Iterator, List, Optional, Tuple
+
+from koda.batch import (
+    collect_results,
+    map_n,
+    maybes_to_results,
+    partition_results,
+    results_to_maybes,
+    sequence_maybes,
+    validate,
+)
+from koda.maybe import Just, Maybe, nothing
+from koda.result import Err, Ok, Result
+
+
+def test_collect_results() -> None:
+    assert collect_results([]) == Ok([])
+    assert collect_results([Ok(1), Ok(2), Ok(3)]) == Ok([1, 2, 3])
+    mixed: List[Result[int, str]] = [Ok(1), Err("a"), Ok(3), Err("b")]
+    assert collect_results(mixed) == Err("a")
+    assert collect_results((Ok(i) for i in range(3)), False) == Ok([0, 1, 2])
+
+
+def test_collect_results_short_circuits() -> None:
+    consumed: List[int] = []
+
+    def gen() -> Iterator[Result[int, str]]:
+        for i in range(5):
+            consumed.append(i)
+            if i == 2:
+                yield Err("stop")
+            else:
+                yield Ok(i)
+
+    err: Err[str] = Err("x")
+    results: List[Result[int, str]] = [Ok(1), err, Ok(2)]
+    assert collect_results(results) is err
+    assert collect_results(gen()) == Err("stop")
+    assert consumed == [0, 1, 2]
+
+
+def test_collect_results_accumulate() -> None:
+    assert collect_results([], True) == Ok([])
+    assert collect_results([Ok(1), Ok(2)], accumulate=True) == Ok([1, 2])
+    mixed: List[Result[int, str]] = [Ok(1), Err("a"), Ok(3), Err("b")]
+    assert collect_results(mixed, accumulate=True) == Err(["a", "b"])
+
+
+def test_partition_results() -> None:
+    assert partition_results([]) == ([], [])
+    results: List[Result[int, str]] = [Ok(1), Err("a"), Ok(3), Err("b")]
+    assert partition_results(results) == ([1, 3], ["a", "b"])
+    assert partition_results(iter(results)) == ([1, 3], ["a", "b"])
+
+
+def test_sequence_maybes() -> None:
+    assert sequence_maybes([]) == Just([])
+    optionals: List[Maybe[Optional[int]]] = [Just(1), Just(None)]
+    assert sequence_maybes(optionals) == Just([1, None])
+    maybes: List[Maybe[int]] = [Just(1), nothing, Just(3)]
+    assert sequence_maybes(maybes) is nothing
+    assert sequence_maybes(iter(maybes)) is nothing
+
+
+def test_results_to_maybes() -> None:
+    assert results_to_maybes([]) == []
+    results: List[Result[int, str]] = [Ok(1), Err("a"), Ok(3)]
+    assert results_to_maybes(iter(results)) == [Just(1), nothing, Just(3)]
+    assert results_to_maybes(results) == [result.to_maybe for result in results]
+
+
+def test_maybes_to_results() -> None:
+    assert maybes_to_results([], "missing") == []
+    maybes: List[Maybe[Optional[int]]] = [Just(1), nothing, Just(None), nothing]
+    assert maybes_to_results(iter(maybes), "missing") == [
+        Ok(1),
+        Err("missing"),
+        Ok(None),
+        Err("missing"),
+    ]
+    assert maybes_to_results(maybes, "missing") == [
+        maybe.to_result("missing") for maybe in maybes
+    ]
+
+
+def test_validate() -> None:
+    assert validate() == Ok(())
+    assert validate(Ok(1)) == Ok((1,))
+    assert validate(Ok(1), Ok("a"), Ok(None)) == Ok((1, "a", None))
+    assert validate(Ok(1), Err("a"), Ok(3), Err("b")) == Err(("a", "b"))
+    assert validate(Err("a")) == Err(("a",))
+    assert validate(*[Ok(i) for i in range(10)]) == Ok(tuple(range(10)))
+
+
+def test_map_n() -> None:
+    calls: List[Tuple[int, ...]] = []
+
+    def add(*nums: int) -> int:
+        calls.append(nums)
+        return sum(nums)
+
+    assert map_n(add) == Ok(0)
+    assert map_n(add, Ok(1)) == Ok(1)
+    assert map_n(add, Ok(1), Ok(2), Ok(3), Ok(4), Ok(5)) == Ok(15)
+    assert map_n(add, *[Ok(i) for i in range(10)]) == Ok(45)
+    assert calls == [(), (1,), (1, 2, 3, 4, 5), tuple(range(10))]
+
+    calls.clear()
+    assert map_n(add, Err("a"), Ok(2), Err("c")) == Err(("a", "c"))
+    assert calls == []
+
+
+def test_map_n_matches_apply() -> None:
+    def combine(a: int, b: str) -> str:
+        return f"{a}{b}"
+
+    pairs: List[Tuple[Result[int, str], Result[str, str]]] = [
+        (Ok(1), Ok("a")),
+        (Err("x"), Ok("a")),
+        (Ok(1), Err("y")),
+    ]
+    for r1, r2 in pairs:
+        applied = r2.apply(r1.map(lambda a: lambda b: combine(a, b)))
+        mapped = map_n(combine, r1, r2)
+        assert applied.to_maybe == mapped.to_maybe
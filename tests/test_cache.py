@@ -0,0 +1,169 @@
+import asyncio
+import threading
+import time
+from typing import List
+
+from koda.cache import AsyncLoadOnce, CacheInfo, LoadOnce, Memoized, memoize
+from koda.result import Err, Ok, Result
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_load_once() -> None:
+    calls: List[int] = []
+
+    def load() -> int:
+        calls.append(1)
+        return len(calls)
+
+    loader = LoadOnce(load)
+    assert loader() == 1
+    assert loader() == 1
+    assert calls == [1]
+
+    loader.invalidate()
+    assert loader() == 2
+    assert loader() == 2
+
+
+def test_load_once_ttl() -> None:
+    clock = _FakeClock()
+    calls: List[int] = []
+
+    def load() -> int:
+        calls.append(1)
+        return len(calls)
+
+    loader = LoadOnce(load, ttl=10, clock=clock)
+    assert loader() == 1
+    clock.now = 9.9
+    assert loader() == 1
+    clock.now = 10.0
+    assert loader() == 2
+    clock.now = 19.9
+    assert loader() == 2
+
+
+def test_load_once_single_flight() -> None:
+    calls: List[int] = []
+    started = threading.Event()
+
+    def slow_load() -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return 5
+
+    loader = LoadOnce(slow_load)
+    results: List[int] = []
+
+    def call() -> None:
+        results.append(loader())
+
+    threads = [threading.Thread(target=call) for _ in range(10)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == [1]
+    assert results == [5] * 10
+
+
+def test_async_load_once() -> None:
+    clock = _FakeClock()
+    calls: List[int] = []
+
+    async def load() -> int:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def run() -> None:
+        loader = AsyncLoadOnce(load, ttl=10, clock=clock)
+        assert await asyncio.gather(*[loader() for _ in range(5)]) == [1] * 5
+        assert await loader() == 1
+        assert calls == [1]
+
+        loader.invalidate()
+        assert await loader() == 2
+
+        clock.now = 10.0
+        assert await loader() == 3
+        assert await loader() == 3
+
+    asyncio.run(run())
+
+
+def test_memoize() -> None:
+    calls: List[int] = []
+
+    @memoize()
+    def double(n: int) -> int:
+        calls.append(n)
+        return n * 2
+
+    assert isinstance(double, Memoized)
+    assert double(1) == 2
+    assert double(1) == 2
+    assert double(2) == 4
+    assert calls == [1, 2]
+    assert double.cache_info() == CacheInfo(hits=1, misses=2, maxsize=128, currsize=2)
+
+    double.cache_clear()
+    assert double.cache_info() == CacheInfo(hits=0, misses=0, maxsize=128, currsize=0)
+    assert double(1) == 2
+    assert calls == [1, 2, 1]
+
+
+def test_memoize_lru_eviction() -> None:
+    calls: List[int] = []
+
+    @memoize(maxsize=2)
+    def inc(n: int) -> int:
+        calls.append(n)
+        return n + 1
+
+    inc(1)
+    inc(2)
+    inc(1)  # 1 is now the most recently used
+    inc(3)  # evicts 2
+    assert inc.cache_info().currsize == 2
+    inc(1)
+    inc(2)
+    assert calls == [1, 2, 3, 2]
+
+    unbounded: Memoized[int, int] = Memoized(lambda n: n, maxsize=None)
+    for i in range(1000):
+        unbounded(i)
+    assert unbounded.cache_info().currsize == 1000
+
+
+def test_memoize_errs() -> None:
+    calls: List[int] = []
+
+    def parse(n: int) -> Result[int, str]:
+        calls.append(n)
+        return Ok(n) if n > 0 else Err("bad")
+
+    retrying = memoize()(parse)
+    assert retrying(1) == Ok(1)
+    assert retrying(1) == Ok(1)
+    assert retrying(0) == Err("bad")
+    assert retrying(0) == Err("bad")
+    assert calls == [1, 0, 0]
+    assert retrying.cache_info() == CacheInfo(hits=1, misses=3, maxsize=128, currsize=1)
+
+    calls.clear()
+    caching = memoize(cache_errs=True)(parse)
+    assert caching(0) == Err("bad")
+    assert caching(0) == Err("bad")
+    assert calls == [0]
@@ -0,0 +1,98 @@
+from typing import Any, Callable, List
+
+import pytest
+
+from koda.dispatch import match_either, match_maybe, match_result
+from koda.either import Either, Either3, Either5, Fifth, First, Fourth, Second, Third
+from koda.maybe import Just, Maybe, nothing
+from koda.result import Err, Ok, Result
+
+
+def test_match_either() -> None:
+    describe = match_either(
+        first=lambda n: f"int {n}",
+        second=lambda s: f"str {s}",
+    )
+    eithers: List[Either[int, str]] = [First(1), Second("a")]
+    assert [describe(either) for either in eithers] == ["int 1", "str a"]
+
+
+def test_match_either3() -> None:
+    describe = match_either(
+        first=lambda n: f"int {n}",
+        second=lambda s: f"str {s}",
+        third=lambda f: f"float {f}",
+    )
+    eithers: List[Either3[int, str, float]] = [First(1), Second("a"), Third(1.5)]
+    assert [describe(either) for either in eithers] == [
+        "int 1",
+        "str a",
+        "float 1.5",
+    ]
+    # the handlers don't cover the other variants
+    with pytest.raises(TypeError):
+        describe(Fourth(None))  # type: ignore[arg-type]
+
+
+def test_match_either5() -> None:
+    handle = match_either(
+        first=lambda x: 1,
+        second=lambda x: 2,
+        third=lambda x: 3,
+        fourth=lambda x: 4,
+        fifth=lambda x: x,
+    )
+    eithers: List[Either5[Any, Any, Any, Any, int]] = [
+        First(None),
+        Second(None),
+        Third(None),
+        Fourth(None),
+        Fifth(5),
+    ]
+    assert [handle(either) for either in eithers] == [1, 2, 3, 4, 5]
+
+
+def test_match_either_checks_handlers() -> None:
+    handle: Callable[[Any], None] = lambda x: None
+    with pytest.raises(TypeError):
+        match_either(first=handle, second=handle, fourth=handle)  # type: ignore
+    with pytest.raises(TypeError):
+        match_either(  # type: ignore
+            first=handle, second=handle, third=handle, fifth=handle
+        )
+    with pytest.raises(TypeError):
+        match_either(first=None, second=handle)  # type: ignore
+    with pytest.raises(TypeError):
+        match_either(first=handle, second="not callable")  # type: ignore
+    with pytest.raises(TypeError):
+        match_either(First, Second)  # type: ignore
+
+
+def test_match_result() -> None:
+    to_str = match_result(ok=lambda n: f"ok {n}", err=lambda e: f"err {e}")
+    results: List[Result[int, str]] = [Ok(1), Err("bad")]
+    assert [to_str(result) for result in results] == ["ok 1", "err bad"]
+    with pytest.raises(TypeError):
+        to_str(Just(1))  # type: ignore[arg-type]
+
+    with pytest.raises(TypeError):
+        match_result(ok=lambda n: n, err=None)  # type: ignore
+
+
+def test_match_maybe() -> None:
+    or_zero = match_maybe(just=lambda n: n, nothing=lambda: 0)
+    maybes: List[Maybe[int]] = [Just(5), nothing]
+    assert [or_zero(maybe) for maybe in maybes] == [5, 0]
+    with pytest.raises(TypeError):
+        or_zero(Ok(1))  # type: ignore[arg-type]
+
+    with pytest.raises(TypeError):
+        match_maybe(just=lambda n: n, nothing=0)  # type: ignore
+
+
+def test_handler_errors_propagate() -> None:
+    def fail(val: Any) -> None:
+        raise KeyError(val)
+
+    with pytest.raises(KeyError):
+        match_result(ok=fail, err=fail)(Ok(1))
@@ -0,0 +1,82 @@
+from typing import Any, Dict, Generator, List, Tuple
+
+import pytest
+
+from koda.do import maybe_do, result_do
+from koda.maybe import Just, Maybe, nothing
+from koda.result import Err, Ok, Result
+from koda.utils import mapping_get
+
+
+def _parse_int(s: str) -> Result[int, str]:
+    return Ok(int(s)) if s.isdigit() else Err(f"{s} is not an int")
+
+
+def test_result_do() -> None:
+    @result_do
+    def add(a: str, b: str) -> Generator[Result[int, str], Any, int]:
+        x: int = yield _parse_int(a)
+        y: int = yield _parse_int(b)
+        return x + y
+
+    assert add("1", "2") == Ok(3)
+    assert add("a", "2") == Err("a is not an int")
+    assert add("1", b="b") == Err("b is not an int")
+    assert add.__name__ == "add"
+
+
+def test_result_do_without_yields() -> None:
+    @result_do
+    def constant() -> Generator[Result[Any, str], Any, int]:
+        yield from ()
+        return 5
+
+    assert constant() == Ok(5)
+
+
+def test_result_do_short_circuits_and_cleans_up() -> None:
+    log: List[str] = []
+
+    @result_do
+    def steps() -> Generator[Result[int, str], Any, int]:
+        try:
+            x: int = yield Ok(1)
+            log.append("first")
+            yield Err("stop")
+            log.append("second")
+            return x
+        finally:
+            log.append("closed")
+
+    assert steps() == Err("stop")
+    assert log == ["first", "closed"]
+
+
+def test_result_do_rejects_other_values() -> None:
+    @result_do
+    def bad() -> Generator[Any, Any, int]:
+        yield Just(1)
+        return 1
+
+    with pytest.raises(TypeError):
+        bad()
+
+
+def test_maybe_do() -> None:
+    @maybe_do
+    def get_both(data: Dict[str, int]) -> Generator[Maybe[int], Any, Tuple[int, int]]:
+        a = yield mapping_get(data, "a")
+        b = yield mapping_get(data, "b")
+        return a, b
+
+    assert get_both({"a": 1, "b": 2}) == Just((1, 2))
+    assert get_both({"a": 1}) == nothing
+    assert get_both({}) == nothing
+
+    @maybe_do
+    def bad() -> Generator[Any, Any, int]:
+        yield Ok(1)
+        return 1
+
+    with pytest.raises(TypeError):
+        bad()
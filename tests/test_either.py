@@ -1,7 +1,7 @@
 from typing import Any, Type
 
 from koda.either import Fifth, First, Fourth, Second, Third
-from tests.utils import enforce_functor_one_val
+from tests.utils import enforce_functor_one_val, enforce_hashable_immutable
 
 
 def _append_bla(s: str) -> str:
@@ -71,3 +71,9 @@ def test_fifth() -> None:
     _test_second_returns_self(Fifth)
     _test_third_returns_self(Fifth)
     _test_fourth_returns_self(Fifth)
+
+
+def test_hashable_immutable() -> None:
+    for ordinal in [First, Second, Third, Fourth, Fifth]:
+        enforce_hashable_immutable(ordinal)
+    assert len({First(1), Second(1), Third(1), Fourth(1), Fifth(1)}) == 5
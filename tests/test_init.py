@@ -0,0 +1,36 @@
+import subprocess
+import sys
+
+import pytest
+
+import koda
+from koda.result import Ok
+from koda.utils import compose
+
+
+def test_lazy_names() -> None:
+    assert koda.Ok is Ok
+    assert koda.compose is compose
+    for name in koda.__all__:
+        assert getattr(koda, name) is not None
+        assert name in dir(koda)
+    assert "either" in dir(koda)
+
+    with pytest.raises(AttributeError):
+        koda.not_a_name  # type: ignore[attr-defined]
+
+
+def test_import_only_what_is_used() -> None:
+    code = (
+        "import sys\n"
+        "from koda import Ok, nothing\n"
+        "assert Ok(1).to_maybe.to_result('x') == Ok(1)\n"
+        "assert nothing.to_result('x').to_maybe is nothing\n"
+        "print(sorted(m for m in sys.modules if m.startswith('koda')))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert "koda.utils" not in out
+    assert "koda.either" not in out
+    assert "koda.maybe" in out
@@ -0,0 +1,118 @@
+import builtins
+from typing import Iterator
+
+import pytest
+
+from koda import instrument
+from koda.instrument import instrumented, snapshot
+from koda.result import Err, Ok, Result
+from koda.utils import safe_try
+
+
+@pytest.fixture(autouse=True)
+def _clean_instrumentation() -> Iterator[None]:
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+@instrumented()
+def _parse(s: str) -> Result[int, ValueError]:
+    try:
+        return Ok(int(s))
+    except ValueError as e:
+        return Err(e)
+
+
+@instrumented("positive")
+def _positive(n: int) -> Result[int, str]:
+    if n < 0:
+        raise TypeError("negative")
+    return Ok(n) if n else Err("zero")
+
+
+def test_disabled_by_default() -> None:
+    assert not instrument.is_enabled()
+    assert _parse("1") == Ok(1)
+    assert safe_try(int, "1") == Ok(1)
+    assert snapshot() == {}
+
+
+def test_instrumented() -> None:
+    instrument.enable()
+    assert instrument.is_enabled()
+    for s in ["1", "2", "a", "3"]:
+        _parse(s)
+    _positive(0)
+    with pytest.raises(TypeError):
+        _positive(-1)
+
+    snap = snapshot()
+    assert set(snap) == {"tests.test_instrument._parse", "positive"}
+    parse = snap["tests.test_instrument._parse"]
+    assert parse["calls"] == 4
+    assert (parse["oks"], parse["errs"], parse["ok_ratio"]) == (3, 1, 0.75)
+    assert parse["err_types"] == {"builtins.ValueError": 1}
+    latency = parse["latency"]
+    assert 0 < latency["p50"] <= latency["p90"] <= latency["p99"] <= latency["max"]
+
+    # exceptions are counted, and re-raised
+    positive = snap["positive"]
+    assert (positive["calls"], positive["errs"], positive["exceptions"]) == (2, 1, 1)
+    assert positive["ok_ratio"] == 0
+    assert len(instrument._registry["positive"].latencies) == 2
+    assert parse["exceptions"] == 0
+    assert snap["positive"]["err_types"] == {"builtins.str": 1}
+    assert _parse.__name__ == "_parse"
+
+
+def test_err_types_include_the_module() -> None:
+    class ConnectionError(Exception):
+        pass
+
+    @instrumented("connect")
+    def connect(builtin: bool) -> Result[None, Exception]:
+        return Err(builtins.ConnectionError() if builtin else ConnectionError())
+
+    instrument.enable()
+    connect(True)
+    connect(False)
+    assert snapshot()["connect"]["err_types"] == {
+        "builtins.ConnectionError": 1,
+        "tests.test_instrument.test_err_types_include_the_module.<locals>"
+        ".ConnectionError": 1,
+    }
+
+
+def test_safe_try_is_instrumented() -> None:
+    instrument.enable()
+    assert safe_try(int, "1") == Ok(1)
+    assert safe_try(int, "10", 2) == Ok(2)
+    assert safe_try(pow, 2, 3, 5) == Ok(3)
+    assert type(safe_try(int, "a").val) is ValueError
+
+    snap = snapshot()
+    assert snap["safe_try:builtins.int"]["calls"] == 3
+    assert snap["safe_try:builtins.int"]["err_types"] == {"builtins.ValueError": 1}
+    assert snap["safe_try:builtins.pow"]["oks"] == 1
+
+
+def test_disable_and_reset() -> None:
+    instrument.enable()
+    _parse("1")
+    instrument.disable()
+    _parse("2")
+    assert snapshot()["tests.test_instrument._parse"]["calls"] == 1
+    instrument.reset()
+    assert snapshot() == {}
+
+
+def test_latencies_are_bounded() -> None:
+    instrument.enable()
+    for i in range(instrument.LATENCY_SAMPLES + 10):
+        _parse(str(i))
+    stats = instrument._registry["tests.test_instrument._parse"]
+    assert len(stats.latencies) == instrument.LATENCY_SAMPLES
+    assert snapshot()["tests.test_instrument._parse"]["calls"] == (
+        instrument.LATENCY_SAMPLES + 10
+    )
@@ -1,3 +1,5 @@
+import copy
+import pickle
 from typing import Any
 
 from koda import Err, Ok
@@ -5,6 +7,7 @@ from koda.maybe import Just, Nothing, nothing
 from tests.utils import (
     enforce_applicative_apply,
     enforce_functor_one_val,
+    enforce_hashable_immutable,
     enforce_monad_flat_map,
     enforce_monad_unit,
 )
@@ -42,8 +45,18 @@ def test_to_result() -> None:
 
 def test_nothing_singleton() -> None:
     assert nothing is Nothing()
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        assert pickle.loads(pickle.dumps(nothing, protocol)) is nothing
+    assert copy.copy(nothing) is nothing
+    assert copy.deepcopy(nothing) is nothing
 
 
 def test_is_just() -> None:
     assert Just(1).is_just is True
     assert nothing.is_just is False
+
+
+def test_hashable_immutable() -> None:
+    enforce_hashable_immutable(Just)
+    assert hash(nothing) == hash(Nothing())
+    assert len({nothing, Nothing(), Just(None)}) == 2
@@ -0,0 +1,91 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count
+from typing import Iterator, List
+
+import pytest
+
+from koda.parallel import imap_results, map_results
+from koda.result import Err, Ok, Result
+from tests.utils import assert_same_error_type_with_same_message
+
+
+def _parse(s: str) -> int:
+    return int(s)
+
+
+_ITEMS: List[str] = ["1", "2", "x", "4", "", "6", "7"]
+
+
+def _check(results: List[Result[int, Exception]]) -> None:
+    assert len(results) == len(_ITEMS)
+    assert [r for r in results if isinstance(r, Ok)] == [
+        Ok(1),
+        Ok(2),
+        Ok(4),
+        Ok(6),
+        Ok(7),
+    ]
+    assert_same_error_type_with_same_message(
+        results[2], Err(ValueError("invalid literal for int() with base 10: 'x'"))
+    )
+    assert_same_error_type_with_same_message(
+        results[4], Err(ValueError("invalid literal for int() with base 10: ''"))
+    )
+
+
+def test_map_results_threads() -> None:
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for chunksize in [1, 2, 3, 100]:
+            _check(map_results(_parse, _ITEMS, executor=executor, chunksize=chunksize))
+        assert map_results(_parse, [], executor=executor) == []
+
+        with pytest.raises(ValueError):
+            map_results(_parse, _ITEMS, executor=executor, chunksize=0)
+
+
+def test_map_results_processes() -> None:
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        _check(map_results(_parse, _ITEMS, executor=executor, chunksize=3))
+
+
+def test_imap_results() -> None:
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for chunksize in [1, 2, 3, 100]:
+            for max_pending in [1, 2, None]:
+                _check(
+                    list(
+                        imap_results(
+                            _parse,
+                            _ITEMS,
+                            executor=executor,
+                            chunksize=chunksize,
+                            max_pending=max_pending,
+                        )
+                    )
+                )
+
+        with pytest.raises(ValueError):
+            list(imap_results(_parse, _ITEMS, executor=executor, max_pending=0))
+
+
+def test_imap_results_processes() -> None:
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        _check(list(imap_results(_parse, _ITEMS, executor=executor, chunksize=2)))
+
+
+def test_imap_results_is_lazy() -> None:
+    consumed: List[int] = []
+
+    def numbers() -> Iterator[str]:
+        for i in count():
+            consumed.append(i)
+            yield str(i)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = imap_results(
+            _parse, numbers(), executor=executor, chunksize=10, max_pending=2
+        )
+        assert [next(results) for _ in range(5)] == [Ok(i) for i in range(5)]
+        # only as many chunks as `max_pending` allows have been taken
+        assert len(consumed) <= 30
+        results.close()
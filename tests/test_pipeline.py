@@ -0,0 +1,118 @@
+from typing import Any, Callable, List
+
+from koda.pipeline import ResultPipeline
+from koda.result import Err, Ok, Result
+
+
+def _inc(n: int) -> int:
+    return n + 1
+
+
+def _double(n: int) -> int:
+    return n * 2
+
+
+def _positive(n: int) -> Result[int, str]:
+    return Ok(n) if n > 0 else Err(f"{n} is not positive")
+
+
+def _even(n: int) -> Result[int, str]:
+    return Ok(n) if n % 2 == 0 else Err(f"{n} is odd")
+
+
+def _shout(s: str) -> str:
+    return s.upper()
+
+
+def _exclaim(s: str) -> str:
+    return f"{s}!"
+
+
+def test_empty_pipeline_returns_input() -> None:
+    run = ResultPipeline[int, int, str]().compile()
+    ok: Result[int, str] = Ok(1)
+    err: Result[int, str] = Err("x")
+    assert run(ok) is ok
+    assert run(err) is err
+
+
+def test_map() -> None:
+    run = ResultPipeline[int, int, str]().map(_inc).map(str).compile()
+    assert run(Ok(1)) == Ok("2")
+    assert run(Err("x")) == Err("x")
+
+
+def test_flat_map_returns_final_container_unchanged() -> None:
+    final: Result[int, str] = Ok(10)
+
+    def to_final(_: int) -> Result[int, str]:
+        return final
+
+    run = ResultPipeline[int, int, str]().map(_inc).flat_map(to_final).compile()
+    assert run(Ok(1)) is final
+
+
+def test_err_skips_to_map_err() -> None:
+    calls: List[str] = []
+
+    def record(s: str) -> str:
+        calls.append(s)
+        return s
+
+    run = (
+        ResultPipeline[int, int, str]()
+        .flat_map(_positive)
+        .map_err(record)
+        .map(_double)
+        .flat_map(_even)
+        .map_err(_shout)
+        .compile()
+    )
+    assert run(Ok(-1)) == Err("-1 IS NOT POSITIVE")
+    assert calls == ["-1 is not positive"]
+    assert run(Err("bad")) == Err("BAD")
+    assert calls == ["-1 is not positive", "bad"]
+    assert run(Ok(2)) == Ok(4)
+
+
+def test_matches_method_chain() -> None:
+    stages: List[Any] = [
+        ("map", _inc),
+        ("flat_map", _positive),
+        ("map_err", _shout),
+        ("map", _double),
+        ("flat_map", _even),
+        ("map_err", _exclaim),
+        ("map", _inc),
+        ("flat_map", _positive),
+    ]
+
+    for i in range(len(stages) + 1):
+        pipeline: ResultPipeline[int, Any, Any] = ResultPipeline()
+        for name, fn in stages[:i]:
+            pipeline = getattr(pipeline, name)(fn)
+        run: Callable[[Result[int, Any]], Result[Any, Any]] = pipeline.compile()
+
+        starts: List[Result[int, str]] = [
+            Ok(-3),
+            Ok(-1),
+            Ok(0),
+            Ok(1),
+            Ok(2),
+            Ok(5),
+            Err("e"),
+        ]
+        for start in starts:
+            expected: Any = start
+            for name, fn in stages[:i]:
+                expected = getattr(expected, name)(fn)
+            assert run(start) == expected
+
+
+def test_compiled_pipeline_is_reusable() -> None:
+    base = ResultPipeline[int, int, str]().map(_inc)
+    run_a = base.map(_double).compile()
+    run_b = base.flat_map(_even).compile()
+    assert run_a(Ok(1)) == Ok(4)
+    assert run_b(Ok(1)) == Ok(2)
+    assert run_b(Ok(2)) == Err("3 is odd")
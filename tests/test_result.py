@@ -1,10 +1,20 @@
 from typing import Any
 
 from koda.maybe import Just, nothing
-from koda.result import Err, Ok, Result
+from koda.result import (
+    Err,
+    Ok,
+    Result,
+    disable_intern_stats,
+    enable_intern_stats,
+    intern_err,
+    intern_stats,
+    reset_intern_stats,
+)
 from tests.utils import (
     enforce_applicative_apply,
     enforce_functor_one_val,
+    enforce_hashable_immutable,
     enforce_monad_flat_map,
     enforce_monad_unit,
 )
@@ -83,3 +93,100 @@ def test_to_optional() -> None:
 def test_is_ok() -> None:
     assert Ok(1).is_ok is True
     assert Err(1).is_ok is False
+
+
+def test_ok_of() -> None:
+    for val in [None, True, False, -5, 0, 256]:
+        assert Ok.of(val) is Ok.of(val)
+        assert Ok.of(val) == Ok(val)
+    assert Ok.of(1) is not Ok.of(True)
+    assert type(Ok.of(1).val) is int
+    assert Ok.of(True).val is True
+
+    for uncached in [-6, 257, 1.0, "abc", (1, 2)]:
+        assert Ok.of(uncached) == Ok(uncached)
+        assert Ok.of(uncached) is not Ok.of(uncached)
+
+
+def test_err_of() -> None:
+    for val in [None, True, False, -5, 0, 256]:
+        assert Err.of(val) is Err.of(val)
+        assert Err.of(val) == Err(val)
+    assert Err.of(0) is not Err.of(False)
+    assert Err.of(0) != Ok.of(0)
+
+    for uncached in [-6, 257, 1.0, "abc", (1, 2), [1]]:
+        assert Err.of(uncached) == Err(uncached)
+        assert Err.of(uncached) is not Err.of(uncached)
+
+
+def test_intern_err() -> None:
+    assert Err.of("not_found") is not Err.of("not_found")
+
+    not_found = intern_err("not_found")
+    assert not_found == Err("not_found")
+    assert intern_err("not_found") is not_found
+    assert Err.of("not_found") is not_found
+    # unregistered values of a registered type are still allocated
+    assert Err.of("other") is not Err.of("other")
+
+    # equal values of another type are kept apart
+    one = intern_err(1.0)
+    assert Err.of(1.0) is one
+    assert Err.of(1) is not one
+    assert Err.of(True) is not one
+
+    # ints outside the shared range, such as status codes
+    not_found_code = intern_err(404)
+    assert Err.of(404) is not_found_code
+    assert intern_err(-100) is Err.of(-100)
+    assert Err.of(500) is not Err.of(500)
+
+    # unhashable values of a registered type can't have been registered
+    intern_err(("not_found",))
+    assert Err.of((["x"],)) == Err((["x"],))
+
+
+def test_intern_stats() -> None:
+    reset_intern_stats()
+    # not counted by default
+    Ok.of(None)
+    Err.of(5000)
+    assert set(intern_stats().values()) == {0}
+
+    enable_intern_stats()
+    assert intern_stats() == {
+        "ok_hits": 0,
+        "ok_misses": 0,
+        "err_hits": 0,
+        "err_misses": 0,
+    }
+    Ok.of(None)
+    Ok.of(True)
+    Ok.of(5)
+    Ok.of(5000)
+    intern_err("counted")
+    Err.of(False)
+    Err.of(5)
+    Err.of(None)
+    Err.of("counted")
+    Err.of(5000)
+    Err.of("never registered")
+    assert intern_stats() == {
+        "ok_hits": 3,
+        "ok_misses": 1,
+        "err_hits": 4,
+        "err_misses": 2,
+    }
+    disable_intern_stats()
+    Ok.of(None)
+    assert intern_stats()["ok_hits"] == 3
+    reset_intern_stats()
+    assert set(intern_stats().values()) == {0}
+
+
+def test_hashable_immutable() -> None:
+    enforce_hashable_immutable(Ok)
+    enforce_hashable_immutable(Err)
+    assert hash(Ok(1)) != hash(Err(1))
+    assert hash(Ok.of(1)) == hash(Ok(1))
@@ -0,0 +1,189 @@
+import io
+import json
+import pickle
+from typing import Any, List
+
+import pytest
+
+from koda.either import Fifth, First, Fourth, Second, Third
+from koda.maybe import Just, nothing
+from koda.result import Err, Ok
+from koda.serde import (
+    Container,
+    JsonFormat,
+    decode,
+    encode,
+    from_tagged,
+    json_default,
+    json_object_hook,
+    to_tagged,
+)
+
+_ALL: List[Container] = [
+    Ok(1),
+    Err("bad"),
+    Just([1, 2]),
+    nothing,
+    First(None),
+    Second(2.5),
+    Third(Ok(3)),
+    Fourth({"a": 1}),
+    Fifth(nothing),
+]
+
+
+def test_encode_decode() -> None:
+    tags, vals = encode(_ALL)
+    assert tags == bytes(range(9))
+    assert vals == [1, "bad", [1, 2], None, 2.5, Ok(3), {"a": 1}, nothing]
+    assert decode(tags, vals) == _ALL
+    assert decode(tags, vals)[3] is nothing
+
+    assert encode([]) == (b"", [])
+    assert decode(b"", []) == []
+    assert encode(iter([nothing, nothing])) == (b"\x03\x03", [])
+
+    # the encoded form survives pickling
+    assert decode(*pickle.loads(pickle.dumps(encode(_ALL)))) == _ALL
+
+
+def test_encode_decode_errors() -> None:
+    with pytest.raises(TypeError):
+        encode([Ok(1), 1])  # type: ignore[list-item]
+    with pytest.raises(ValueError):
+        decode(b"\x00\x09", [1, 2])
+    with pytest.raises(ValueError):
+        decode(b"\x00\x00", [1])
+    with pytest.raises(ValueError):
+        decode(b"\x00", [1, 2])
+
+
+def test_tagged() -> None:
+    assert [to_tagged(container) for container in _ALL] == [
+        {"ok": 1},
+        {"err": "bad"},
+        {"just": [1, 2]},
+        {"nothing": None},
+        {"first": None},
+        {"second": 2.5},
+        {"third": Ok(3)},
+        {"fourth": {"a": 1}},
+        {"fifth": nothing},
+    ]
+    for container in _ALL:
+        assert from_tagged(to_tagged(container)) == container
+    assert from_tagged({"nothing": None}) is nothing
+
+
+def test_tagged_errors() -> None:
+    bad: Any
+    for bad in [{}, {"ok": 1, "err": 2}, {"okay": 1}]:
+        with pytest.raises(ValueError):
+            from_tagged(bad)
+    with pytest.raises(TypeError):
+        to_tagged(1)  # type: ignore[arg-type]
+
+
+def test_json_hooks() -> None:
+    data = {"user": Ok(Just({"name": "a"})), "errors": [Err("bad"), nothing]}
+    dumped = json.dumps(data, default=json_default)
+    assert json.loads(dumped) == {
+        "user": {"__koda__": "ok", "val": {"__koda__": "just", "val": {"name": "a"}}},
+        "errors": [{"__koda__": "err", "val": "bad"}, {"__koda__": "nothing"}],
+    }
+    assert json.loads(dumped, object_hook=json_object_hook) == data
+    dumped = json.dumps(_ALL, default=json_default)
+    assert json.loads(dumped, object_hook=json_object_hook) == _ALL
+
+    with pytest.raises(TypeError):
+        json.dumps(object(), default=json_default)
+
+    # other objects are left alone, including ones keyed by a container name
+    for other in [
+        {},
+        {"a": 1},
+        {"ok": 1},
+        {"first": "Ada"},
+        {"nothing": None},
+        {"__koda__": "ok"},
+        {"__koda__": "okay", "val": 1},
+    ]:
+        assert json.loads(json.dumps(other), object_hook=json_object_hook) == other
+
+
+def test_json_format_one_key() -> None:
+    fmt = JsonFormat(tag_key=None)
+    dumped = json.dumps(_ALL, default=fmt.default)
+    assert json.loads(dumped)[:4] == [
+        {"ok": 1},
+        {"err": "bad"},
+        {"just": [1, 2]},
+        {"nothing": None},
+    ]
+    assert json.loads(dumped, object_hook=fmt.object_hook) == _ALL
+
+    for other in [{}, {"a": 1}, {"ok": 1, "err": 2}, {"nothing": 1}]:
+        assert json.loads(json.dumps(other), object_hook=fmt.object_hook) == other
+
+
+def test_json_format_tag_key() -> None:
+    fmt = JsonFormat(tag_key="type", val_key="value", names={Ok: "success"})
+    data = [Ok(1), Err("bad"), nothing]
+    dumped = json.dumps(data, default=fmt.default)
+    assert json.loads(dumped) == [
+        {"type": "success", "value": 1},
+        {"type": "err", "value": "bad"},
+        {"type": "nothing"},
+    ]
+    assert json.loads(dumped, object_hook=fmt.object_hook) == data
+
+    for other in [
+        {"type": "ok", "value": 1},
+        {"type": "err"},
+        {"type": "nothing", "value": None},
+        {"type": "err", "val": 1},
+        {"type": "err", "value": 1, "extra": 2},
+        {"type": ["err"], "value": 1},
+        {"value": 1},
+    ]:
+        assert json.loads(json.dumps(other), object_hook=fmt.object_hook) == other
+
+    with pytest.raises(ValueError):
+        JsonFormat(names={Ok: "err"})
+
+
+def test_json_lines() -> None:
+    fmt = JsonFormat()
+    out = io.StringIO()
+    fmt.dump_lines(iter(_ALL[:4]), out)
+    assert out.getvalue().splitlines() == [
+        '{"__koda__": "ok", "val": 1}',
+        '{"__koda__": "err", "val": "bad"}',
+        '{"__koda__": "just", "val": [1, 2]}',
+        '{"__koda__": "nothing"}',
+    ]
+
+    out.write("\n")
+    out.seek(0)
+    assert list(fmt.load_lines(out)) == _ALL[:4]
+
+    fmt.dump_lines([], out)
+    assert list(fmt.load_lines([])) == []
+
+    # the same output as `json.dumps`
+    tricky: List[Container] = [
+        Ok('é\n"'),
+        Just(float("inf")),
+        Second([Ok(1.5), {"a": nothing}]),
+    ]
+    out = io.StringIO()
+    fmt.dump_lines(tricky, out)
+    assert out.getvalue().splitlines() == [
+        json.dumps(container, default=json_default) for container in tricky
+    ]
+
+    # circular references are still detected
+    loop: List[Any] = []
+    loop.append(Ok(loop))
+    with pytest.raises(ValueError):
+        fmt.dump_lines(loop, io.StringIO())
@@ -0,0 +1,98 @@
+from itertools import count
+from typing import Iterator, List, Optional
+
+import pytest
+
+from koda.maybe import Just, Maybe, nothing
+from koda.result import Err, Ok, Result
+from koda.stream import (
+    chunked_collect,
+    errors_only,
+    filter_just,
+    filter_ok,
+    flat_map_ok,
+    map_ok,
+    take_until_err,
+)
+
+_RESULTS: List[Result[int, str]] = [Ok(1), Err("a"), Ok(2), Ok(3), Err("b"), Ok(4)]
+
+
+def _parsed_forever() -> Iterator[Result[int, str]]:
+    for i in count():
+        yield Err(f"bad {i}") if i % 3 == 2 else Ok(i)
+
+
+def _half(n: int) -> Result[int, str]:
+    return Ok(n // 2) if n % 2 == 0 else Err(f"{n} is odd")
+
+
+def test_filter_ok() -> None:
+    assert list(filter_ok(_RESULTS)) == [1, 2, 3, 4]
+    assert list(filter_ok([])) == []
+
+
+def test_filter_just() -> None:
+    maybes: List[Maybe[Optional[int]]] = [Just(1), nothing, Just(None), nothing]
+    assert list(filter_just(maybes)) == [1, None]
+
+
+def test_errors_only() -> None:
+    assert list(errors_only(_RESULTS)) == ["a", "b"]
+
+
+def test_map_ok() -> None:
+    assert list(map_ok(_RESULTS, str)) == [
+        Ok("1"),
+        Err("a"),
+        Ok("2"),
+        Ok("3"),
+        Err("b"),
+        Ok("4"),
+    ]
+
+
+def test_flat_map_ok() -> None:
+    assert list(flat_map_ok(_RESULTS, _half)) == [
+        Err("1 is odd"),
+        Err("a"),
+        Ok(1),
+        Err("3 is odd"),
+        Err("b"),
+        Ok(2),
+    ]
+
+
+def test_take_until_err() -> None:
+    assert list(take_until_err(_RESULTS)) == [Ok(1), Err("a")]
+    assert list(take_until_err([Ok(1), Ok(2)])) == [Ok(1), Ok(2)]
+
+    stream = _parsed_forever()
+    assert list(take_until_err(stream)) == [Ok(0), Ok(1), Err("bad 2")]
+    # nothing past the `Err` was consumed
+    assert next(stream) == Ok(3)
+
+
+def test_chunked_collect() -> None:
+    assert list(chunked_collect(_RESULTS, 2)) == [Err("a"), Ok([2, 3]), Err("b")]
+    assert list(chunked_collect(_RESULTS, 4, accumulate=True)) == [
+        Err(["a"]),
+        Err(["b"]),
+    ]
+    assert list(chunked_collect(_RESULTS, 100, False)) == [Err("a")]
+    assert list(chunked_collect([Ok(1), Ok(2), Ok(3)], 2, True)) == [
+        Ok([1, 2]),
+        Ok([3]),
+    ]
+    assert list(chunked_collect([], 2)) == []
+
+    with pytest.raises(ValueError):
+        chunked_collect(_RESULTS, 0)
+
+
+def test_operators_are_lazy() -> None:
+    stream = map_ok(flat_map_ok(_parsed_forever(), _half), str)
+    assert next(filter_ok(stream)) == "0"
+    assert next(errors_only(_parsed_forever())) == "bad 2"
+    assert next(filter_just(Just(i) for i in count())) == 0
+    assert next(chunked_collect(_parsed_forever(), 2)) == Ok([0, 1])
@@ -0,0 +1,82 @@
+import sys
+from typing import List
+
+from koda.maybe import Just, Maybe, nothing
+from koda.result import Err, Ok, Result
+from koda.trampoline import Bounce, FlatMap, Step, run
+
+# well past the recursion limit
+_DEPTH = sys.getrecursionlimit() * 20
+
+
+def _sum_to(n: int) -> Step[Result[int, str]]:
+    if n < 0:
+        return Err("negative")
+    if n == 0:
+        return Ok(0)
+    return FlatMap(Bounce(lambda: _sum_to(n - 1)), lambda total: Ok(total + n))
+
+
+def test_run_finished() -> None:
+    assert run(Ok(1)) == Ok(1)
+    assert run(nothing) == nothing
+
+
+def test_run_deep_result() -> None:
+    assert run(_sum_to(_DEPTH)) == Ok(_DEPTH * (_DEPTH + 1) // 2)
+
+
+def test_run_err_short_circuits() -> None:
+    called: List[int] = []
+
+    def record(total: int) -> Result[int, str]:
+        called.append(total)
+        return Ok(total)
+
+    failing: Step[Result[int, str]] = FlatMap(FlatMap(Err("bad"), record), record)
+    assert run(failing) == Err("bad")
+    assert called == []
+
+    # fails partway down
+    def descend(n: int) -> Step[Result[int, str]]:
+        if n == 0:
+            return Err("bottom")
+        return FlatMap(Bounce(lambda: descend(n - 1)), record)
+
+    assert run(descend(_DEPTH)) == Err("bottom")
+    assert called == []
+
+
+def test_run_deep_maybe() -> None:
+    def lookup(n: int) -> Step[Maybe[int]]:
+        if n == 0:
+            return Just(0)
+        return FlatMap(Bounce(lambda: lookup(n - 1)), lambda val: Just(val + 1))
+
+    assert run(lookup(_DEPTH)) == Just(_DEPTH)
+
+    def missing(n: int) -> Step[Maybe[int]]:
+        if n == 0:
+            return nothing
+        return FlatMap(Bounce(lambda: missing(n - 1)), lambda val: Just(val + 1))
+
+    assert run(missing(_DEPTH)) == nothing
+
+
+def test_run_continuations_returning_steps() -> None:
+    # each continuation recurses again, so the chain grows to the right
+    def count_up(n: int) -> Step[Result[int, str]]:
+        return FlatMap(
+            Ok(n), lambda val: count_up(val + 1) if val < _DEPTH else Ok(val)
+        )
+
+    assert run(count_up(0)) == Ok(_DEPTH)
+
+    def is_even(n: int) -> Step[Result[bool, str]]:
+        return Ok(True) if n == 0 else Bounce(lambda: is_odd(n - 1))
+
+    def is_odd(n: int) -> Step[Result[bool, str]]:
+        return Ok(False) if n == 0 else Bounce(lambda: is_even(n - 1))
+
+    assert run(is_even(_DEPTH)) == Ok(True)
+    assert run(is_odd(_DEPTH)) == Ok(False)
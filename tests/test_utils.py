@@ -1,13 +1,24 @@
-from typing import Dict, List, Optional, Tuple, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple, Union
+from unittest.mock import Mock
 
+import pytest
+
+from koda._cruft import _composed
 from koda._generics import A, B
 from koda.maybe import Just, nothing
 from koda.result import Err, Ok, Result
 from koda.utils import (
+    _compile_path,
     always,
     compose,
+    identity,
     load_once,
     mapping_get,
+    mapping_get_all,
+    mapping_get_many,
+    mapping_get_path,
+    returns_result,
     safe_try,
     thunkify,
     to_maybe,
@@ -106,6 +117,55 @@ def test_compose8() -> None:
     assert composed_func(7.3) == ("5", "a")
 
 
+def test_compose_many() -> None:
+    for num_fns in range(9, 30):
+        assert compose(*([_inc] * num_fns))(0) == num_fns
+    assert compose(_halve, _float_to_int, *([_inc] * 10), _int_to_str)(7.3) == "14"
+
+
+def test_compose_one_or_none() -> None:
+    assert compose(_inc) is _inc
+    assert compose() is identity
+    assert compose()(5) == 5
+
+
+def test_compose_flattens_nested() -> None:
+    inner = compose(_halve, _float_to_int)
+    outer = compose(inner, _inc, compose(_int_to_str, _prepend_a))
+    assert outer(7.3) == "a5"
+    assert _composed[outer] == (
+        _halve,
+        _float_to_int,
+        _inc,
+        _int_to_str,
+        _prepend_a,
+    )
+
+
+def test_compose_fuses_identity() -> None:
+    assert compose(identity, _inc, identity) is _inc
+    assert compose(identity, identity) is identity
+    composed_func = compose(_inc, identity, _int_to_str)
+    assert composed_func(1) == "2"
+    assert _composed[composed_func] == (_inc, _int_to_str)
+
+
+def test_compose_other_callables() -> None:
+    # answers any attribute lookup, but isn't a composition to flatten
+    mock = Mock(return_value=1)
+    assert compose(mock, _inc)(None) == 2
+    mock.assert_called_once_with(None)
+
+    class Unhashable:
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, obj: Any) -> int:
+            return 3
+
+    # neither hashable nor weakly referenceable
+    assert compose(Unhashable(), _inc, str, len)(None) == 1
+
+
 def test_load_once() -> None:
     some_list: List[int] = [1, 2, 3]
 
@@ -185,6 +245,36 @@ def test_safe_try_with_more_params() -> None:
     )
 
 
+def test_returns_result() -> None:
+    @returns_result()
+    def divide(a: int, b: int, *, scale: int = 1) -> float:
+        return scale * a / b
+
+    assert divide(4, 2) == Ok(2.0)
+    assert divide(4, 2, scale=3) == Ok(6.0)
+    assert_same_error_type_with_same_message(
+        divide(4, 0), Err(ZeroDivisionError("division by zero"))
+    )
+    assert divide.__name__ == "divide"
+
+    @returns_result((KeyError, ValueError))
+    def parse(data: Dict[str, str], key: str) -> int:
+        return int(data[key])
+
+    assert parse({"a": "1"}, "a") == Ok(1)
+    assert_same_error_type_with_same_message(parse({}, "a"), Err(KeyError("a")))
+    assert type(parse({"a": "x"}, "a").val) is ValueError
+    with pytest.raises(TypeError):
+        parse(None, "a")
+
+    @returns_result(ZeroDivisionError)
+    def reciprocal(*args: int) -> float:
+        return 1 / sum(args)
+
+    assert reciprocal(1, 1, 2) == Ok(0.25)
+    assert type(reciprocal(1, -1).val) is ZeroDivisionError
+
+
 def test_mapping_get() -> None:
     d: Dict[str, Optional[str]] = {"a": None, "b": "ok"}
 
@@ -193,6 +283,60 @@ def test_mapping_get() -> None:
     assert mapping_get(d, "c") == nothing
 
 
+def test_mapping_get_many() -> None:
+    d = {"a": None, "b": "ok"}
+    assert mapping_get_many(d, ["a", "b", "c"]) == (Just(None), Just("ok"), nothing)
+    assert mapping_get_many(d, []) == ()
+
+
+def test_mapping_get_all() -> None:
+    d = {"a": None, "b": "ok"}
+    assert mapping_get_all(d, ["a", "b"]) == Just((None, "ok"))
+    assert mapping_get_all(d, ["a", "c", "b"]) == nothing
+    assert mapping_get_all(d, []) == Just(())
+
+
+def test_mapping_get_path() -> None:
+    d: Dict[Any, Any] = {
+        "a": {"b": [{"c": None}, ("x", "y")]},
+        1: {"z": "int key"},
+        "s": "string",
+    }
+    assert mapping_get_path(d, ("a", "b", 0, "c")) == Just(None)
+    assert mapping_get_path(d, ["a", "b", 1, -1]) == Just("y")
+    assert mapping_get_path(d, (1, "z")) == Just("int key")
+    assert mapping_get_path(d, ()) == Just(d)
+    assert mapping_get_path(MappingProxyType(d), ("a", "b", 1, 0)) == Just("x")
+
+    assert mapping_get_path(d, ("a", "c")) == nothing
+    assert mapping_get_path(d, ("a", "b", 2)) == nothing
+    assert mapping_get_path(d, ("a", "b", -3)) == nothing
+    # only ints index into sequences, and strings aren't indexed into at all
+    assert mapping_get_path(d, ("a", "b", "0")) == nothing
+    assert mapping_get_path(d, ("a", "b", True)) == nothing
+    assert mapping_get_path(d, ("s", 0)) == nothing
+    assert mapping_get_path(d, ("a", "b", 0, "c", "d")) == nothing
+
+
+def test_mapping_get_path_equal_keys_of_other_types() -> None:
+    # `("a", 1) == ("a", True) == ("a", 1.0)`, so the cache must tell them apart
+    d = {"a": ["x", "y"]}
+    for order in [(1, True, 1.0), (True, 1.0, 1), (1.0, 1, True)]:
+        _compile_path.cache_clear()
+        for key in order:
+            expected = Just("y") if type(key) is int else nothing
+            assert mapping_get_path(d, ("a", key)) == expected
+
+
+def test_mapping_get_path_is_cached() -> None:
+    _compile_path.cache_clear()
+    for _ in range(3):
+        mapping_get_path({"a": 1}, ("a",))
+        mapping_get_path({"a": 1}, ["a"])
+    info = _compile_path.cache_info()
+    assert (info.hits, info.misses) == (5, 1)
+
+
 def test_to_maybe() -> None:
     assert to_maybe(5) == Just(5)
     assert to_maybe("abc") == Just("abc")
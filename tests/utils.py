@@ -1,5 +1,7 @@
 from typing import Any, Type
 
+import pytest
+
 from koda import compose, identity
 from koda.result import Err, Result
 
@@ -76,3 +78,25 @@ def enforce_applicative_apply(applyable: Type[Any], non_applyable: Any) -> None:
     assert applyable(test_val).apply(non_applyable) == non_applyable
 
     assert non_applyable.apply(applyable(_int_to_str)) == non_applyable
+
+
+def enforce_hashable_immutable(container: Type[Any]) -> None:
+    obj = container((1, "a"))
+    same = container((1, "a"))
+    assert obj == same
+    assert hash(obj) == hash(same) == hash(obj)
+    assert hash(obj) != hash(container((2, "a")))
+    assert len({obj, same, container(2)}) == 2
+    assert {obj: "found"}[same] == "found"
+
+    with pytest.raises(AttributeError):
+        obj.val = 2
+    with pytest.raises(AttributeError):
+        del obj.val
+    # re-initialising leaves the value alone
+    obj.__init__((2, "a"))
+    assert obj.val == (1, "a")
+    assert hash(obj) == hash(same)
+
+    with pytest.raises(TypeError):
+        hash(container([1]))